@@ -1,21 +1,38 @@
-"""AI Agents for GroundedCV."""
-
-from app.agents.base import (
-    AgentConnectionError,
-    AgentError,
-    AgentMetadata,
-    AgentQueryError,
-    AgentResponse,
-    BaseAgent,
-    quick_query,
-)
+"""AI Agents for GroundedCV.
+
+Errors, metadata types and the background task queue are importable without
+loading claude_agent_sdk; the SDK-backed names (BaseAgent, quick_query) are imported from
+app.agents.base on first access.
+"""
+
+from typing import TYPE_CHECKING, Any
+
+from app.agents.errors import AgentConnectionError, AgentError, AgentQueryError, AgentRateLimitError
+from app.agents.metadata import AgentMetadata, AgentResponse
+from app.agents.tasks import AgentTask, AgentTaskQueue
+
+if TYPE_CHECKING:
+    from app.agents.base import BaseAgent, quick_query
+
+_LAZY_BASE_EXPORTS = frozenset({"BaseAgent", "quick_query"})
 
 __all__ = [
     "AgentConnectionError",
     "AgentError",
     "AgentMetadata",
     "AgentQueryError",
+    "AgentRateLimitError",
     "AgentResponse",
+    "AgentTask",
+    "AgentTaskQueue",
     "BaseAgent",
     "quick_query",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_BASE_EXPORTS:
+        from app.agents import base
+
+        return getattr(base, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,17 @@
 """Base Agent class for GroundedCV AI agents using Claude Agent SDK."""
 
+import asyncio
+import functools
+import hashlib
 import logging
+import re
+import time
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Literal
+from collections.abc import AsyncIterator, Callable, Iterator, MutableMapping, Sequence
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Any
 
 from claude_agent_sdk import (
     AssistantMessage,
@@ -16,105 +22,297 @@ from claude_agent_sdk import (
     query,
 )
 
+from app.agents.errors import AgentConnectionError, AgentError, AgentQueryError, AgentRateLimitError
+from app.agents.metadata import AgentMetadata, AgentResponse
 from app.config import settings
-from app.utils.retry import RetryConfig, retry_async_generator
+from app.utils.cache import TTLCache
+from app.utils.retry import RetryConfig, retry_async, retry_async_generator
+
+__all__ = [
+    "AgentConnectionError",
+    "AgentError",
+    "AgentMetadata",
+    "AgentQueryError",
+    "AgentRateLimitError",
+    "AgentResponse",
+    "BaseAgent",
+    "quick_query",
+]
+
+
+@functools.cache
+def _get_cwd() -> str:
+    """Resolve the CLI working directory (settings.data_dir) once per process.
+
+    Path.resolve() hits the filesystem, and data_dir is fixed for the
+    lifetime of the process; a settings change requires a restart.
+    """
+    return str(settings.data_dir.resolve())
 
 
-class AgentError(Exception):
-    """Base exception for agent-related errors."""
+@functools.lru_cache(maxsize=256)
+def _get_agent_logger(name: str) -> logging.Logger:
+    """Return the ``grounded-cv.agents.<name>`` logger.
 
-    def __init__(self, message: str, agent_name: str | None = None):
-        self.agent_name = agent_name
-        super().__init__(message)
+    Memoized so short-lived agents skip the f-string and the locked
+    registry lookup in logging.getLogger().
+    """
+    return logging.getLogger(f"grounded-cv.agents.{name}")
 
 
-class AgentConnectionError(AgentError):
-    """Raised when connection to Claude SDK fails."""
+def _sdk_env() -> dict[str, str]:
+    """Build the environment overrides passed to the Claude CLI subprocess.
 
-    pass
+    The CLI marks the system prompt and tool schema with ephemeral
+    cache_control breakpoints on its own, so repeated calls with the same
+    agent configuration read the prefix from Anthropic's prompt cache.
+    ``settings.prompt_caching_enabled`` turns that off when needed
+    (e.g. when debugging prompt changes).
 
+    Returns:
+        Environment variables for ClaudeAgentOptions.env
+    """
+    if settings.prompt_caching_enabled:
+        return {}
+    return {"DISABLE_PROMPT_CACHING": "1"}
+
+
+@functools.lru_cache(maxsize=32)
+def _build_options(
+    model: str,
+    system_prompt: str | None,
+    tools: tuple[str, ...],
+    max_turns: int | None,
+) -> ClaudeAgentOptions:
+    """Build (and memoize) ClaudeAgentOptions for one configuration.
+
+    Agents and quick queries with the same model, system prompt, tools and
+    max_turns share one options object, so every call sends an identical
+    prefix. The result is shared: treat it as read-only.
+    """
+    return ClaudeAgentOptions(
+        model=model,
+        system_prompt=system_prompt,
+        allowed_tools=list(tools),
+        max_turns=max_turns,
+        permission_mode="acceptEdits",  # Auto-accept for automation
+        cwd=_get_cwd(),
+        env=_sdk_env(),
+    )
 
-class AgentQueryError(AgentError):
-    """Raised when a query to Claude fails."""
 
-    pass
+# Transport-level failures that are worth retrying
+_TRANSIENT_ERRORS: tuple[type[Exception], ...] = (ConnectionError, TimeoutError, OSError)
 
 
-@dataclass
-class AgentMetadata:
-    """Metadata about an agent execution."""
+# Exact-type lookup for the message classes the agent loops care about
+_MESSAGE_KINDS: dict[type, type] = {
+    AssistantMessage: AssistantMessage,
+    ResultMessage: ResultMessage,
+}
 
-    agent_name: str
-    model_used: str
-    tokens_in: int = 0
-    tokens_out: int = 0
-    latency_ms: int = 0
-    cost_usd: float = 0.0
-    started_at: datetime = field(default_factory=datetime.now)
-    completed_at: datetime | None = None
-    session_id: str | None = None
 
-    @classmethod
-    def from_result_message(
-        cls,
-        agent_name: str,
-        model: str,
-        result: ResultMessage,
-        started_at: datetime,
-    ) -> "AgentMetadata":
-        """Create metadata from SDK ResultMessage.
+def _message_kind(message: object) -> type | None:
+    """Classify an SDK message as AssistantMessage, ResultMessage, or neither.
 
-        Args:
-            agent_name: Name of the agent
-            model: Model used for the request
-            result: ResultMessage from claude-agent-sdk
-            started_at: When the request started
+    Tries a dict lookup on the exact type first and only falls back to
+    isinstance() (an MRO walk) for subclasses or unrelated message types.
+    """
+    kind = _MESSAGE_KINDS.get(type(message))
+    if kind is not None:
+        return kind
+    if isinstance(message, AssistantMessage):
+        return AssistantMessage
+    if isinstance(message, ResultMessage):
+        return ResultMessage
+    return None
 
-        Returns:
-            AgentMetadata instance populated from the result
-        """
-        usage = result.usage or {}
-        return cls(
-            agent_name=agent_name,
-            model_used=model,
-            tokens_in=usage.get("input_tokens", 0),
-            tokens_out=usage.get("output_tokens", 0),
-            latency_ms=result.duration_ms,
-            cost_usd=result.total_cost_usd or 0.0,
-            started_at=started_at,
-            completed_at=datetime.now(),
-            session_id=result.session_id,
-        )
 
-    def calculate_cost(self) -> float:
-        """Calculate the cost based on model and tokens used.
+def _rate_limit_retry_after(message: object) -> float | None:
+    """Seconds until the limit resets if ``message`` reports a rejection.
 
-        This is a fallback method when SDK doesn't provide cost.
-        Uses Claude pricing as of the documentation date.
+    Matches the SDK's RateLimitEvent by its ``rate_limit_info`` attribute,
+    which older SDK releases do not define.
+
+    Returns:
+        None if the message is not a rejected rate-limit event, otherwise
+        the wait in seconds (0.0 when the CLI gives no reset time)
+    """
+    info = getattr(message, "rate_limit_info", None)
+    if info is None or getattr(info, "status", None) != "rejected":
+        return None
+    resets_at = getattr(info, "resets_at", None)
+    if not isinstance(resets_at, int | float):
+        return 0.0
+    return max(0.0, resets_at - time.time())
+
+
+def _iter_text(message: AssistantMessage) -> Iterator[str]:
+    """Yield the text of each TextBlock in an assistant message."""
+    for block in message.content:
+        if type(block) is TextBlock or isinstance(block, TextBlock):
+            yield block.text
+
+
+async def _iter_messages(
+    messages: AsyncIterator[Any],
+    agent_name: str,
+    model: str,
+    started_at: datetime,
+) -> AsyncIterator[str | AgentMetadata]:
+    """Shared message loop for every query()/receive_response() consumer.
+
+    Args:
+        messages: SDK message stream (query() or receive_response())
+        agent_name: Agent name recorded in the metadata and errors
+        model: Model recorded in the metadata
+        started_at: Request start time recorded in the metadata
+
+    Yields:
+        The text of each assistant message as one ``str`` (its TextBlocks
+        arrive together, so they are joined rather than yielded one by one),
+        then an AgentMetadata for the ResultMessage
+
+    Raises:
+        AgentRateLimitError: If the CLI reports the rate limit was hit
+    """
+    async for message in messages:
+        kind = _message_kind(message)
+        if kind is AssistantMessage:
+            text = "".join(_iter_text(message))
+            if text:
+                yield text
+        elif kind is ResultMessage:
+            yield AgentMetadata.from_result_message(
+                agent_name=agent_name,
+                model=model,
+                result=message,
+                started_at=started_at,
+            )
+        else:
+            retry_after = _rate_limit_retry_after(message)
+            if retry_after is not None:
+                raise AgentRateLimitError(
+                    f"Claude rate limit reached; resets in {retry_after:.0f}s",
+                    agent_name=agent_name,
+                    retry_after=retry_after,
+                )
+
+
+# In-flight stateless calls per model, shared by every agent on the loop.
+# asyncio semaphores bind to the loop that first waits on them, so they are
+# created lazily for each running loop (a second loop appears under
+# pytest-asyncio or when a worker thread runs its own loop).
+_MODEL_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _model_semaphore(model: str) -> asyncio.Semaphore:
+    """Return the concurrency limit for calls to a model on the running loop.
+
+    Sized from the settings of the model's tier; models outside the
+    configured tiers share the balanced limit.
+    """
+    semaphores = _MODEL_SEMAPHORES.setdefault(asyncio.get_running_loop(), {})
+    semaphore = semaphores.get(model)
+    if semaphore is None:
+        if model == settings.model_fast:
+            limit = settings.concurrency_fast
+        elif model == settings.model_reasoning:
+            limit = settings.concurrency_reasoning
+        else:
+            limit = settings.concurrency_balanced
+        semaphore = semaphores[model] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+def _cache_key_text(text: str) -> str:
+    """Normalize line endings and trailing whitespace, which never change an answer.
+
+    Indentation and line breaks are kept: in YAML, code and Markdown they
+    carry meaning.
+    """
+    return "\n".join(line.rstrip() for line in text.replace("\r\n", "\n").split("\n")).rstrip()
+
+
+def _response_cache_key(
+    model: str,
+    system_prompt: str | None,
+    tools: Sequence[str],
+    max_turns: int | None,
+    prompt: str,
+) -> str:
+    """Hash a stateless call into a response cache key.
+
+    Prompts differing only in line endings or trailing whitespace share an
+    entry; any other difference gets its own.
+    """
+    raw = "\0".join(
+        (model, _cache_key_text(system_prompt or ""), "\0".join(tools), str(max_turns), _cache_key_text(prompt))
+    )
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+@functools.cache
+def _shared_response_cache() -> TTLCache[str, tuple[str, AgentMetadata]]:
+    """Process-wide response cache used when an agent is not given its own."""
+    return TTLCache(maxsize=settings.response_cache_max, ttl=settings.response_cache_ttl)
+
+
+def _is_cacheable(metadata: AgentMetadata) -> bool:
+    """Only single-turn answers are cached.
+
+    A ResultMessage with more than one turn means the model called tools,
+    whose results (files, web pages, command output) may differ next time.
+    Fallback metadata (no ResultMessage) reports zero turns and is skipped.
+    """
+    return metadata.num_turns == 1
+
+
+def _cache_hit_metadata(metadata: AgentMetadata, agent_name: str) -> AgentMetadata:
+    """Copy stored metadata for a response served from the cache.
+
+    Nothing was billed and no API call was made, so tokens, cost and latency
+    are zeroed; the stored entry itself is never handed out, so callers
+    cannot alter it or count its cost twice.
+    """
+    now = datetime.now()
+    return replace(
+        metadata,
+        agent_name=agent_name,
+        tokens_in=0,
+        tokens_out=0,
+        latency_ms=0,
+        cost_usd=0.0,
+        started_at=now,
+        completed_at=now,
+        cache_read_tokens=0,
+        cache_creation_tokens=0,
+    )
 
-        Returns:
-            Calculated cost in USD
-        """
-        # Pricing as of December 2024. See https://www.anthropic.com/pricing#anthropic-api
-        pricing = {
-            "opus": {"input": 0.015, "output": 0.075},
-            "sonnet": {"input": 0.003, "output": 0.015},
-            "haiku": {"input": 0.001, "output": 0.005},
-        }
-        if self.model_used in pricing:
-            rates = pricing[self.model_used]
-            self.cost_usd = (self.tokens_in / 1000) * rates["input"] + (self.tokens_out / 1000) * rates["output"]
-        return self.cost_usd
 
+# Several independent questions answered in one call (see _call_claude_batch)
+_BATCH_PROMPT = """Answer each of the following {num_questions} questions independently.
 
-@dataclass
-class AgentResponse:
-    """Response from an agent execution."""
+{questions}
 
-    status: Literal["success", "error", "partial"]
-    output: Any
-    metadata: AgentMetadata
-    errors: list[str] = field(default_factory=list)
+Reply with one <answer> element per question, using the same id, inside a
+single <answers> element:
+<answers>
+<answer id="0">...</answer>
+</answers>"""
+_BATCH_ANSWER_RE = re.compile(r'<answer id="(\d+)">\s*(.*?)\s*</answer>', re.DOTALL)
+
+
+def _split_batch_answers(text: str, count: int) -> list[str | None]:
+    """Pick the answers out of a batched response, by question id."""
+    answers: list[str | None] = [None] * count
+    for match in _BATCH_ANSWER_RE.finditer(text):
+        index = int(match.group(1))
+        if index < count:
+            answers[index] = match.group(2)
+    return answers
 
 
 class BaseAgent(ABC):
@@ -137,10 +335,34 @@ class BaseAgent(ABC):
         async with MyAgent("agent") as agent:
             response1, _ = await agent._continue_conversation("First question")
             response2, meta = await agent._continue_conversation("Follow-up")
+
+    System prompt ordering:
+        The prompt cache matches on an exact prefix, so anything that changes
+        per call (timestamps, session IDs, user details) must not be embedded
+        in ``system_prompt``. Keep ``system_prompt`` static and supply the
+        volatile part through ``system_prompt_dynamic_suffix``; it is appended
+        after the static text so the long stable prefix stays cacheable.
+
+    Subclasses should declare their own ``__slots__`` (``()`` if they add no
+    attributes); otherwise instances regain a per-instance ``__dict__``.
     """
 
+    __slots__ = (
+        "name",
+        "model",
+        "tools",
+        "system_prompt",
+        "system_prompt_dynamic_suffix",
+        "persistent_stateless",
+        "logger",
+        "retry_config",
+        "response_cache",
+        "_default_options",
+        "_client",
+    )
+
     # Default built-in tools available to all agents
-    DEFAULT_TOOLS = [
+    DEFAULT_TOOLS: tuple[str, ...] = (
         "Read",
         "Write",
         "Edit",
@@ -149,15 +371,18 @@ class BaseAgent(ABC):
         "Grep",
         "WebSearch",
         "WebFetch",
-    ]
+    )
 
     def __init__(
         self,
         name: str,
         model: str | None = None,
-        tools: list[str] | None = None,
+        tools: Sequence[str] | None = None,
         system_prompt: str | None = None,
         retry_config: RetryConfig | None = None,
+        system_prompt_dynamic_suffix: Callable[[], str] | None = None,
+        persistent_stateless: bool = False,
+        response_cache: MutableMapping[str, tuple[str, AgentMetadata]] | None = None,
     ):
         """Initialize the agent.
 
@@ -165,14 +390,31 @@ class BaseAgent(ABC):
             name: Unique name for this agent
             model: Model to use (defaults to balanced model from settings)
             tools: List of allowed tools (defaults to DEFAULT_TOOLS)
-            system_prompt: Optional system prompt for this agent
+            system_prompt: Optional static system prompt for this agent
             retry_config: Configuration for retry behavior (defaults from settings)
+            system_prompt_dynamic_suffix: Optional callable returning per-call
+                text appended after the static system prompt
+            persistent_stateless: Route _call_claude through one long-lived
+                ClaudeSDKClient instead of a new query() session per call.
+                Keeps the prompt cache warm, but calls share history; end it
+                with _end_conversation() (or use the context manager).
+            response_cache: Mapping used to memoize stateless _call_claude
+                responses by (model, system prompt, tools, max_turns,
+                prompt). Any MutableMapping works, e.g. a dict or an
+                on-disk store. Defaults to a process-wide TTL/LRU cache when
+                settings.response_cache_enabled is set (off by default),
+                otherwise no caching.
         """
         self.name = name
         self.model = model or settings.model_balanced
-        self.tools = tools if tools is not None else self.DEFAULT_TOOLS
+        self.tools = tuple(tools) if tools is not None else self.DEFAULT_TOOLS
         self.system_prompt = system_prompt
-        self.logger = logging.getLogger(f"grounded-cv.agents.{name}")
+        self.system_prompt_dynamic_suffix = system_prompt_dynamic_suffix
+        self.persistent_stateless = persistent_stateless
+        if response_cache is None and settings.response_cache_enabled:
+            response_cache = _shared_response_cache()
+        self.response_cache = response_cache
+        self.logger = _get_agent_logger(name)
 
         # Retry configuration (from parameter or settings)
         self.retry_config = retry_config or RetryConfig(
@@ -182,13 +424,35 @@ class BaseAgent(ABC):
             exponential_base=settings.retry_exponential_base,
         )
 
+        # Options for calls without overrides, shared by identically configured agents
+        self._default_options = _build_options(self.model, self.system_prompt, self.tools, settings.max_iterations)
+
         # Client for conversational mode (lazy initialization)
         self._client: ClaudeSDKClient | None = None
 
+    def _build_system_prompt(self, system_prompt: str | None = None) -> str | None:
+        """Assemble the system prompt with static text first, dynamic last.
+
+        Args:
+            system_prompt: Override for the static part of the prompt
+
+        Returns:
+            Combined system prompt, or None if neither part is set
+        """
+        static = system_prompt or self.system_prompt
+        if self.system_prompt_dynamic_suffix is None:
+            return static
+        dynamic = self.system_prompt_dynamic_suffix()
+        if not static:
+            return dynamic or None
+        if not dynamic:
+            return static
+        return f"{static}\n\n{dynamic}"
+
     def _get_options(
         self,
         system_prompt: str | None = None,
-        tools: list[str] | None = None,
+        tools: Sequence[str] | None = None,
         max_turns: int | None = None,
         model: str | None = None,
     ) -> ClaudeAgentOptions:
@@ -203,13 +467,22 @@ class BaseAgent(ABC):
         Returns:
             ClaudeAgentOptions configured for this agent
         """
-        return ClaudeAgentOptions(
-            model=model or self.model,
-            system_prompt=system_prompt or self.system_prompt,
-            allowed_tools=tools if tools is not None else self.tools,
-            max_turns=max_turns or settings.max_iterations,
-            permission_mode="acceptEdits",  # Auto-accept for automation
-            cwd=str(settings.data_dir.resolve()),
+        if (
+            system_prompt is None
+            and tools is None
+            and max_turns is None
+            and (model is None or model == self.model)
+            and self.system_prompt_dynamic_suffix is None
+        ):
+            return self._default_options
+        # A dynamic suffix makes every prompt unique, so skip the cache rather
+        # than evicting reusable entries.
+        build = _build_options if self.system_prompt_dynamic_suffix is None else _build_options.__wrapped__
+        return build(
+            model or self.model,
+            self._build_system_prompt(system_prompt),
+            tuple(tools) if tools is not None else self.tools,
+            max_turns or settings.max_iterations,
         )
 
     @abstractmethod
@@ -223,6 +496,32 @@ class BaseAgent(ABC):
         """
         pass
 
+    def _fallback_metadata(self, model: str, started_at: datetime, started_ns: int) -> AgentMetadata:
+        """Build metadata when the SDK sent no ResultMessage.
+
+        Latency is measured with the monotonic perf_counter_ns clock, so it
+        is unaffected by wall-clock adjustments during the call.
+
+        Args:
+            model: Model used for the request
+            started_at: Wall-clock request start time
+            started_ns: time.perf_counter_ns() at request start
+
+        Returns:
+            AgentMetadata with timing only (no token or cost data)
+        """
+        self.logger.warning(
+            "No ResultMessage received from SDK - using fallback metadata (cost and token tracking will be incomplete)"
+        )
+        latency_ms = (time.perf_counter_ns() - started_ns) // 1_000_000
+        return AgentMetadata(
+            agent_name=self.name,
+            model_used=model,
+            latency_ms=latency_ms,
+            started_at=started_at,
+            completed_at=started_at + timedelta(milliseconds=latency_ms),
+        )
+
     # --- Stateless API (query) ---
 
     async def _call_claude(
@@ -230,14 +529,17 @@ class BaseAgent(ABC):
         prompt: str,
         system: str | None = None,
         model: str | None = None,
-        tools: list[str] | None = None,
+        tools: Sequence[str] | None = None,
         max_turns: int | None = None,
+        bypass_cache: bool = False,
     ) -> tuple[str, AgentMetadata]:
         """Call Claude API (stateless) and return response with metadata.
 
         Uses the query() function - creates a new session for each call.
         Best for one-off tasks that don't need conversation history.
         Includes automatic retry with exponential backoff for transient errors.
+        In-flight calls per model are capped across agents by the model
+        tier's settings.concurrency_* limit.
 
         Args:
             prompt: The user prompt to send
@@ -245,6 +547,7 @@ class BaseAgent(ABC):
             model: Model to use (overrides agent default)
             tools: Tools to enable (overrides agent default)
             max_turns: Maximum conversation turns
+            bypass_cache: Skip the agent's response_cache for this call
 
         Returns:
             Tuple of (response_text, metadata)
@@ -255,6 +558,9 @@ class BaseAgent(ABC):
         """
         used_model = model or self.model
 
+        if self.persistent_stateless and used_model == self.model and max_turns is None:
+            return await self._call_claude_persistent(prompt, system=system, tools=tools)
+
         options = self._get_options(
             system_prompt=system,
             tools=tools,
@@ -262,89 +568,243 @@ class BaseAgent(ABC):
             model=used_model,
         )
 
-        self.logger.debug(f"Calling {used_model} with {len(prompt)} chars (stateless)")
+        response_cache = None if bypass_cache else self.response_cache
+        cache_key = ""
+        if response_cache is not None:
+            system_prompt = options.system_prompt if isinstance(options.system_prompt, str) else None
+            cache_key = _response_cache_key(used_model, system_prompt, options.allowed_tools, options.max_turns, prompt)
+            cached = response_cache.get(cache_key)
+            if cached is not None:
+                self.logger.debug("Response cache hit for %s", used_model)
+                return cached[0], _cache_hit_metadata(cached[1], self.name)
 
-        # Retry logic for transient errors
-        last_exception: Exception | None = None
-        for attempt in range(self.retry_config.max_attempts):
-            started_at = datetime.now()
-            response_text = ""
+        self.logger.debug("Calling %s with %d chars (stateless)", used_model, len(prompt))
+
+        async def _attempt() -> tuple[str, AgentMetadata]:
+            chunks: list[str] = []
             metadata: AgentMetadata | None = None
 
             try:
-                async for message in query(prompt=prompt, options=options):
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                response_text += block.text
-                    elif isinstance(message, ResultMessage):
-                        metadata = AgentMetadata.from_result_message(
-                            agent_name=self.name,
-                            model=used_model,
-                            result=message,
-                            started_at=started_at,
-                        )
-
-                # Success - break out of retry loop
-                if metadata is None:
-                    self.logger.warning(
-                        "No ResultMessage received from SDK - using fallback metadata "
-                        "(cost and token tracking will be incomplete)"
-                    )
-                    metadata = AgentMetadata(
-                        agent_name=self.name,
-                        model_used=used_model,
-                        started_at=started_at,
-                        completed_at=datetime.now(),
-                    )
-
-                self.logger.debug(
-                    f"Response: {metadata.tokens_out} tokens, ${metadata.cost_usd:.4f}, {metadata.latency_ms}ms"
-                )
-
-                return response_text, metadata
-
-            except (ConnectionError, TimeoutError, OSError) as e:
-                last_exception = e
-                if attempt < self.retry_config.max_attempts - 1:
-                    import asyncio
-
-                    delay = self.retry_config.calculate_delay(attempt)
-                    self.logger.warning(
-                        f"Attempt {attempt + 1}/{self.retry_config.max_attempts} failed: "
-                        f"{type(e).__name__}: {e}. Retrying in {delay:.2f}s"
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    self.logger.error(f"SDK connection error in _call_claude: {e}")
-                    raise AgentConnectionError(
-                        f"Failed to connect to Claude API: {e}",
-                        agent_name=self.name,
-                    ) from e
+                async with _model_semaphore(used_model):
+                    # Timed from here so queueing for a slot is not billed as API latency
+                    started_at = datetime.now()
+                    started_ns = time.perf_counter_ns()
+                    async for item in _iter_messages(
+                        query(prompt=prompt, options=options), self.name, used_model, started_at
+                    ):
+                        if isinstance(item, str):
+                            chunks.append(item)
+                        else:
+                            metadata = item
+            except _TRANSIENT_ERRORS:
+                raise
+            except AgentRateLimitError:
+                raise
             except Exception as e:
                 # Non-retryable errors - fail immediately
-                self.logger.error(f"Unexpected error in _call_claude: {e}")
+                self.logger.error("Unexpected error in _call_claude: %s", e)
                 raise AgentQueryError(
                     f"Query to Claude failed: {e}",
                     agent_name=self.name,
                 ) from e
 
-        # Should not reach here, but handle edge case
-        if last_exception is not None:
+            if metadata is None:
+                metadata = self._fallback_metadata(used_model, started_at, started_ns)
+            return "".join(chunks), metadata
+
+        try:
+            response_text, metadata = await retry_async(_attempt, _TRANSIENT_ERRORS, self.retry_config, self.logger)
+        except _TRANSIENT_ERRORS as e:
+            self.logger.error("SDK connection error in _call_claude: %s", e)
             raise AgentConnectionError(
-                f"Failed to connect to Claude API: {last_exception}",
+                f"Failed to connect to Claude API: {e}",
                 agent_name=self.name,
-            ) from last_exception
+            ) from e
 
-        raise RuntimeError("Unexpected state in _call_claude retry logic")
+        self.logger.debug(
+            "Response: %d tokens, $%.4f, %dms",
+            metadata.tokens_out,
+            metadata.cost_usd,
+            metadata.latency_ms,
+        )
+
+        if response_cache is not None and _is_cacheable(metadata):
+            response_cache[cache_key] = (response_text, replace(metadata, session_id=None))
+        return response_text, metadata
+
+    async def _call_claude_many(
+        self,
+        prompts: Sequence[str],
+        max_concurrency: int | None = None,
+        system: str | None = None,
+        model: str | None = None,
+        tools: Sequence[str] | None = None,
+        max_turns: int | None = None,
+    ) -> list[tuple[str, AgentMetadata]]:
+        """Run several independent prompts concurrently.
+
+        All prompts share the same options, so they hit the same cached
+        system prompt/tool prefix. A persistent-stateless agent has a single
+        session, so its prompts are sent one at a time.
+
+        When a call is rate limited, every prompt in the batch pauses until
+        the limit resets (or for the exponential backoff delay, whichever is
+        longer) before retrying, up to retry_config.max_attempts times.
+
+        Args:
+            prompts: Prompts to send
+            max_concurrency: Maximum number of in-flight calls
+                (defaults to settings.max_concurrent_llm)
+            system: Optional system prompt (overrides agent default)
+            model: Model to use (overrides agent default)
+            tools: Tools to enable (overrides agent default)
+            max_turns: Maximum conversation turns
+
+        Returns:
+            List of (response_text, metadata) in the same order as prompts
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            AgentConnectionError: If a call fails to connect after retries
+            AgentRateLimitError: If a call is still rate limited after retries,
+                or the limit resets later than retry_config.max_delay
+            AgentQueryError: If a call fails
+        """
+        if max_concurrency is None:
+            max_concurrency = settings.max_concurrent_llm
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if self.persistent_stateless:
+            max_concurrency = 1
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        loop = asyncio.get_running_loop()
+        resume_at = 0.0  # loop time before which no new call may start
+
+        async def _one(prompt: str) -> tuple[str, AgentMetadata]:
+            nonlocal resume_at
+            attempt = 0
+            while True:
+                # Sit out a batch-wide pause before taking a slot, so paused
+                # prompts do not hold one
+                while (wait := resume_at - loop.time()) > 0:
+                    await asyncio.sleep(wait)
+                async with semaphore:
+                    if resume_at > loop.time():
+                        continue  # a pause began while waiting for the slot
+                    try:
+                        return await self._call_claude(
+                            prompt, system=system, model=model, tools=tools, max_turns=max_turns
+                        )
+                    except AgentRateLimitError as e:
+                        delay = max(self.retry_config.calculate_delay(attempt), e.retry_after or 0.0)
+                        if attempt == self.retry_config.max_attempts - 1 or delay > self.retry_config.max_delay:
+                            raise
+                        resume_at = max(resume_at, loop.time() + delay)
+                self.logger.warning(
+                    "Rate limited (attempt %d/%d); pausing batch for %.2fs",
+                    attempt + 1,
+                    self.retry_config.max_attempts,
+                    delay,
+                )
+                attempt += 1
+
+        return list(await asyncio.gather(*(_one(prompt) for prompt in prompts)))
+
+    async def _call_claude_batch(
+        self,
+        prompts: Sequence[str],
+        system: str | None = None,
+        model: str | None = None,
+        tools: Sequence[str] | None = None,
+    ) -> tuple[list[str], AgentMetadata]:
+        """Answer several short, independent prompts in a single call.
+
+        The prompts are numbered into one request and the model replies
+        with one tagged answer per prompt. Compared with _call_claude_many
+        this sends the system prompt once and makes one round trip, at the
+        cost of a single shared metadata record. Best for small prompts
+        such as scoring bullets or generating variants.
+
+        Args:
+            prompts: Prompts to answer
+            system: Optional system prompt (overrides agent default)
+            model: Model to use (overrides agent default)
+            tools: Tools to enable (overrides agent default)
+
+        Returns:
+            Tuple of (answers in the same order as prompts, metadata for the call)
+
+        Raises:
+            ValueError: If prompts is empty
+            AgentConnectionError: If connection to Claude fails after retries
+            AgentQueryError: If the query fails or an answer is missing
+        """
+        if not prompts:
+            raise ValueError("prompts must not be empty")
+        if len(prompts) == 1:
+            text, metadata = await self._call_claude(prompts[0], system=system, model=model, tools=tools)
+            return [text], metadata
+
+        questions = "\n".join(f'<question id="{i}">\n{prompt}\n</question>' for i, prompt in enumerate(prompts))
+        text, metadata = await self._call_claude(
+            _BATCH_PROMPT.format(num_questions=len(prompts), questions=questions),
+            system=system,
+            model=model,
+            tools=tools,
+        )
+
+        answers = _split_batch_answers(text, len(prompts))
+        missing = [i for i, answer in enumerate(answers) if answer is None]
+        if missing:
+            raise AgentQueryError(
+                f"Batched response is missing answers for question ids {missing}",
+                agent_name=self.name,
+            )
+        return [answer for answer in answers if answer is not None], metadata
+
+    async def _call_claude_persistent(
+        self,
+        prompt: str,
+        system: str | None = None,
+        tools: Sequence[str] | None = None,
+    ) -> tuple[str, AgentMetadata]:
+        """Send a prompt through the agent's long-lived client.
+
+        Lazily starts the session on first use, then reuses it so the
+        system prompt and tool schema stay in the prompt cache between calls.
+        ``system`` and ``tools`` only take effect when the session is started.
+
+        Args:
+            prompt: The user prompt to send
+            system: Optional system prompt for a new session
+            tools: Tools to enable for a new session
+
+        Returns:
+            Tuple of (response_text, metadata)
+
+        Raises:
+            AgentConnectionError: If the session cannot be started or is lost
+            AgentQueryError: If the query fails
+        """
+        if self._client is None:
+            await self._start_conversation(system=system, tools=tools)
+
+        started_at = datetime.now()
+        started_ns = time.perf_counter_ns()
+        response_text, metadata = await self._continue_conversation(prompt)
+        if metadata is None:
+            metadata = self._fallback_metadata(self.model, started_at, started_ns)
+        return response_text, metadata
 
     async def _stream_claude(
         self,
         prompt: str,
         system: str | None = None,
         model: str | None = None,
-        tools: list[str] | None = None,
+        tools: Sequence[str] | None = None,
         max_turns: int | None = None,
+        on_complete: Callable[[AgentMetadata], None] | None = None,
     ) -> AsyncIterator[str]:
         """Stream Claude API response (stateless).
 
@@ -352,6 +812,9 @@ class BaseAgent(ABC):
         Yields text chunks as they arrive.
         Includes automatic retry for initial connection failures only
         (mid-stream failures are not retried to avoid duplicate data).
+        Counts against the model tier's settings.concurrency_* limit only
+        while connecting and waiting for the first message, so a slow or
+        abandoned consumer does not keep a slot while the stream is paused.
 
         Args:
             prompt: The user prompt to send
@@ -359,6 +822,8 @@ class BaseAgent(ABC):
             model: Model to use
             tools: Tools to enable
             max_turns: Maximum conversation turns
+            on_complete: Called with the call's metadata (tokens, cost,
+                latency) once the stream has finished
 
         Yields:
             Text chunks as they arrive
@@ -376,50 +841,103 @@ class BaseAgent(ABC):
             model=used_model,
         )
 
-        self.logger.debug(f"Streaming from {used_model} (stateless)")
+        self.logger.debug("Streaming from %s (stateless)", used_model)
 
         async def _create_stream() -> AsyncIterator[str]:
-            """Inner generator for streaming."""
+            """Inner generator for streaming; transient errors propagate raw for retry."""
+            metadata: AgentMetadata | None = None
             try:
-                async for message in query(prompt=prompt, options=options):
-                    if isinstance(message, AssistantMessage):
-                        for block in message.content:
-                            if isinstance(block, TextBlock):
-                                yield block.text
-            except (ConnectionError, TimeoutError, OSError) as e:
-                self.logger.error(f"SDK connection error in _stream_claude: {e}")
-                raise AgentConnectionError(
-                    f"Failed to connect to Claude API: {e}",
-                    agent_name=self.name,
-                ) from e
+                async with _model_semaphore(used_model):
+                    # Timed from here so queueing for a slot is not billed as API latency
+                    started_at = datetime.now()
+                    started_ns = time.perf_counter_ns()
+                    messages = _iter_messages(query(prompt=prompt, options=options), self.name, used_model, started_at)
+                    # The slot is released once the first message is in, never
+                    # across a yield to the consumer
+                    item = await anext(messages, None)
+                while item is not None:
+                    if isinstance(item, str):
+                        yield item
+                    else:
+                        metadata = item
+                    item = await anext(messages, None)
+            except _TRANSIENT_ERRORS:
+                raise
             except GeneratorExit:
                 self.logger.debug("Stream cancelled by consumer")
                 raise
+            except AgentRateLimitError:
+                raise
             except Exception as e:
-                self.logger.error(f"Unexpected error in _stream_claude: {e}")
+                self.logger.error("Unexpected error in _stream_claude: %s", e)
                 raise AgentQueryError(
                     f"Streaming query to Claude failed: {e}",
                     agent_name=self.name,
                 ) from e
 
-        # Use retry wrapper for initial connection failures
-        async for chunk in retry_async_generator(
-            generator_factory=_create_stream,
-            retryable_exceptions=(AgentConnectionError,),
-            config=self.retry_config,
-            logger=self.logger,
-        ):
-            yield chunk
+            if on_complete is not None:
+                on_complete(metadata or self._fallback_metadata(used_model, started_at, started_ns))
+
+        # Use retry wrapper for initial connection failures; wrap only once
+        # retries are exhausted (or the stream broke mid-way)
+        try:
+            async for chunk in retry_async_generator(
+                generator_factory=_create_stream,
+                retryable_exceptions=_TRANSIENT_ERRORS,
+                config=self.retry_config,
+                logger=self.logger,
+            ):
+                yield chunk
+        except _TRANSIENT_ERRORS as e:
+            self.logger.error("SDK connection error in _stream_claude: %s", e)
+            raise AgentConnectionError(
+                f"Failed to connect to Claude API: {e}",
+                agent_name=self.name,
+            ) from e
 
         self.logger.debug("Stream complete")
 
+    async def _stream_claude_bytes(
+        self,
+        prompt: str,
+        system: str | None = None,
+        model: str | None = None,
+        tools: Sequence[str] | None = None,
+        max_turns: int | None = None,
+        on_complete: Callable[[AgentMetadata], None] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream Claude API response as UTF-8 encoded chunks.
+
+        Same as _stream_claude, but encodes each chunk once at the source so
+        byte sinks (e.g. FastAPI's StreamingResponse) can write it directly.
+
+        Args:
+            prompt: The user prompt to send
+            system: Optional system prompt
+            model: Model to use
+            tools: Tools to enable
+            max_turns: Maximum conversation turns
+            on_complete: Called with the call's metadata once the stream has finished
+
+        Yields:
+            UTF-8 encoded text chunks as they arrive
+
+        Raises:
+            AgentConnectionError: If connection to Claude fails after retries
+            AgentQueryError: If the streaming query fails (not retried)
+        """
+        async for chunk in self._stream_claude(
+            prompt, system=system, model=model, tools=tools, max_turns=max_turns, on_complete=on_complete
+        ):
+            yield chunk.encode("utf-8")
+
     # --- Conversational API (ClaudeSDKClient) ---
 
     async def _start_conversation(
         self,
         initial_prompt: str | None = None,
         system: str | None = None,
-        tools: list[str] | None = None,
+        tools: Sequence[str] | None = None,
     ) -> None:
         """Start a new conversation session.
 
@@ -435,47 +953,32 @@ class BaseAgent(ABC):
         Raises:
             AgentConnectionError: If connection to Claude fails after retries
         """
-        import asyncio
-
         options = self._get_options(system_prompt=system, tools=tools)
-        last_exception: Exception | None = None
 
-        for attempt in range(self.retry_config.max_attempts):
+        async def _attempt() -> None:
             self._client = ClaudeSDKClient(options=options)
             try:
                 await self._client.connect(prompt=initial_prompt)
-                self.logger.debug("Started conversation session")
-                return
-            except (ConnectionError, TimeoutError, OSError) as e:
+            except _TRANSIENT_ERRORS:
                 self._client = None
-                last_exception = e
-                if attempt < self.retry_config.max_attempts - 1:
-                    delay = self.retry_config.calculate_delay(attempt)
-                    self.logger.warning(
-                        f"Attempt {attempt + 1}/{self.retry_config.max_attempts} failed: "
-                        f"{type(e).__name__}: {e}. Retrying in {delay:.2f}s"
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    self.logger.error(f"Failed to start conversation: {e}")
-                    raise AgentConnectionError(
-                        f"Failed to connect to Claude API: {e}",
-                        agent_name=self.name,
-                    ) from e
+                raise
             except Exception as e:
                 self._client = None
-                self.logger.error(f"Unexpected error starting conversation: {e}")
+                self.logger.error("Unexpected error starting conversation: %s", e)
                 raise AgentConnectionError(
                     f"Failed to start conversation: {e}",
                     agent_name=self.name,
                 ) from e
 
-        # Should not reach here
-        if last_exception is not None:
+        try:
+            await retry_async(_attempt, _TRANSIENT_ERRORS, self.retry_config, self.logger)
+        except _TRANSIENT_ERRORS as e:
+            self.logger.error("Failed to start conversation: %s", e)
             raise AgentConnectionError(
-                f"Failed to connect to Claude API: {last_exception}",
+                f"Failed to connect to Claude API: {e}",
                 agent_name=self.name,
-            ) from last_exception
+            ) from e
+        self.logger.debug("Started conversation session")
 
     async def _continue_conversation(
         self,
@@ -497,39 +1000,33 @@ class BaseAgent(ABC):
             raise RuntimeError("No active conversation. Call _start_conversation() first.")
 
         started_at = datetime.now()
-
         try:
             await self._client.query(prompt)
 
-            response_text = ""
+            chunks: list[str] = []
             metadata: AgentMetadata | None = None
 
-            async for message in self._client.receive_response():
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            response_text += block.text
-                elif isinstance(message, ResultMessage):
-                    metadata = AgentMetadata.from_result_message(
-                        agent_name=self.name,
-                        model=self.model,
-                        result=message,
-                        started_at=started_at,
-                    )
-        except (ConnectionError, TimeoutError, OSError) as e:
-            self.logger.error(f"SDK connection error in _continue_conversation: {e}")
+            async for item in _iter_messages(self._client.receive_response(), self.name, self.model, started_at):
+                if isinstance(item, str):
+                    chunks.append(item)
+                else:
+                    metadata = item
+        except _TRANSIENT_ERRORS as e:
+            self.logger.error("SDK connection error in _continue_conversation: %s", e)
             raise AgentConnectionError(
                 f"Connection lost during conversation: {e}",
                 agent_name=self.name,
             ) from e
+        except AgentRateLimitError:
+            raise
         except Exception as e:
-            self.logger.error(f"Unexpected error in _continue_conversation: {e}")
+            self.logger.error("Unexpected error in _continue_conversation: %s", e)
             raise AgentQueryError(
                 f"Conversation query failed: {e}",
                 agent_name=self.name,
             ) from e
 
-        return response_text, metadata
+        return "".join(chunks), metadata
 
     async def _stream_conversation(
         self,
@@ -551,15 +1048,14 @@ class BaseAgent(ABC):
             raise RuntimeError("No active conversation. Call _start_conversation() first.")
 
         try:
+            started_at = datetime.now()
             await self._client.query(prompt)
 
-            async for message in self._client.receive_response():
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            yield block.text
-        except (ConnectionError, TimeoutError, OSError) as e:
-            self.logger.error(f"SDK connection error in _stream_conversation: {e}")
+            async for item in _iter_messages(self._client.receive_response(), self.name, self.model, started_at):
+                if isinstance(item, str):
+                    yield item
+        except _TRANSIENT_ERRORS as e:
+            self.logger.error("SDK connection error in _stream_conversation: %s", e)
             raise AgentConnectionError(
                 f"Connection lost during streaming: {e}",
                 agent_name=self.name,
@@ -567,8 +1063,10 @@ class BaseAgent(ABC):
         except GeneratorExit:
             self.logger.debug("Stream cancelled by consumer")
             raise
+        except AgentRateLimitError:
+            raise
         except Exception as e:
-            self.logger.error(f"Unexpected error in _stream_conversation: {e}")
+            self.logger.error("Unexpected error in _stream_conversation: %s", e)
             raise AgentQueryError(
                 f"Streaming conversation failed: {e}",
                 agent_name=self.name,
@@ -600,7 +1098,7 @@ class BaseAgent(ABC):
         try:
             await self._end_conversation()
         except Exception as cleanup_error:
-            self.logger.error(f"Error during conversation cleanup: {cleanup_error}")
+            self.logger.error("Error during conversation cleanup: %s", cleanup_error)
             # Only raise cleanup error if no original exception
             if exc_val is None:
                 raise
@@ -611,8 +1109,9 @@ async def quick_query(
     prompt: str,
     system_prompt: str | None = None,
     model: str | None = None,
-    tools: list[str] | None = None,
+    tools: Sequence[str] | None = None,
     retry_config: RetryConfig | None = None,
+    bypass_cache: bool = False,
 ) -> str:
     """Quick one-off query without creating an agent instance.
 
@@ -626,6 +1125,7 @@ async def quick_query(
         model: Model to use (defaults to balanced)
         tools: Tools to enable (defaults to all built-in)
         retry_config: Configuration for retry behavior (defaults from settings)
+        bypass_cache: Skip the shared response cache for this call
 
     Returns:
         Response text from Claude
@@ -634,16 +1134,20 @@ async def quick_query(
         AgentConnectionError: If connection to Claude fails after retries
         AgentQueryError: If the query fails (not retried)
     """
-    import asyncio
-
-    logger = logging.getLogger("grounded-cv.agents.quick_query")
-    options = ClaudeAgentOptions(
-        model=model or settings.model_balanced,
-        system_prompt=system_prompt,
-        allowed_tools=tools or BaseAgent.DEFAULT_TOOLS,
-        permission_mode="acceptEdits",
-        cwd=str(settings.data_dir.resolve()),
-    )
+    logger = _get_agent_logger("quick_query")
+    used_model = model or settings.model_balanced
+    used_tools = tuple(tools) if tools else BaseAgent.DEFAULT_TOOLS
+    options = _build_options(used_model, system_prompt, used_tools, None)
+
+    cache: TTLCache[str, tuple[str, AgentMetadata]] | None = None
+    cache_key = ""
+    if not bypass_cache and settings.response_cache_enabled:
+        cache = _shared_response_cache()
+        cache_key = _response_cache_key(used_model, system_prompt, used_tools, None, prompt)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Response cache hit for %s", used_model)
+            return cached[0]
 
     config = retry_config or RetryConfig(
         max_attempts=settings.retry_max_attempts,
@@ -652,34 +1156,32 @@ async def quick_query(
         exponential_base=settings.retry_exponential_base,
     )
 
-    last_exception: Exception | None = None
-    for attempt in range(config.max_attempts):
-        response_text = ""
+    async def _attempt() -> tuple[str, AgentMetadata | None]:
+        chunks: list[str] = []
+        metadata: AgentMetadata | None = None
         try:
-            async for message in query(prompt=prompt, options=options):
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            response_text += block.text
-            return response_text
-        except (ConnectionError, TimeoutError, OSError) as e:
-            last_exception = e
-            if attempt < config.max_attempts - 1:
-                delay = config.calculate_delay(attempt)
-                logger.warning(
-                    f"Attempt {attempt + 1}/{config.max_attempts} failed: "
-                    f"{type(e).__name__}: {e}. Retrying in {delay:.2f}s"
-                )
-                await asyncio.sleep(delay)
-            else:
-                logger.error(f"SDK connection error in quick_query: {e}")
-                raise AgentConnectionError(f"Failed to connect to Claude API: {e}") from e
+            async with _model_semaphore(used_model):
+                messages = query(prompt=prompt, options=options)
+                async for item in _iter_messages(messages, "quick_query", used_model, datetime.now()):
+                    if isinstance(item, str):
+                        chunks.append(item)
+                    else:
+                        metadata = item
+        except _TRANSIENT_ERRORS:
+            raise
+        except AgentRateLimitError:
+            raise
         except Exception as e:
-            logger.error(f"Unexpected error in quick_query: {e}")
+            logger.error("Unexpected error in quick_query: %s", e)
             raise AgentQueryError(f"Quick query failed: {e}") from e
+        return "".join(chunks), metadata
 
-    # Should not reach here
-    if last_exception is not None:
-        raise AgentConnectionError(f"Failed to connect to Claude API: {last_exception}") from last_exception
+    try:
+        response_text, metadata = await retry_async(_attempt, _TRANSIENT_ERRORS, config, logger)
+    except _TRANSIENT_ERRORS as e:
+        logger.error("SDK connection error in quick_query: %s", e)
+        raise AgentConnectionError(f"Failed to connect to Claude API: {e}") from e
 
-    raise RuntimeError("Unexpected state in quick_query retry logic")
+    if cache is not None and metadata is not None and _is_cacheable(metadata):
+        cache[cache_key] = (response_text, replace(metadata, session_id=None))
+    return response_text
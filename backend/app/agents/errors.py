@@ -0,0 +1,29 @@
+"""Exceptions raised by GroundedCV agents."""
+
+
+class AgentError(Exception):
+    """Base exception for agent-related errors."""
+
+    def __init__(self, message: str, agent_name: str | None = None):
+        self.agent_name = agent_name
+        super().__init__(message)
+
+
+class AgentConnectionError(AgentError):
+    """Raised when connection to Claude SDK fails."""
+
+    pass
+
+
+class AgentQueryError(AgentError):
+    """Raised when a query to Claude fails."""
+
+    pass
+
+
+class AgentRateLimitError(AgentQueryError):
+    """Raised when the Claude CLI reports that the rate limit was hit."""
+
+    def __init__(self, message: str, agent_name: str | None = None, retry_after: float | None = None):
+        self.retry_after = retry_after
+        super().__init__(message, agent_name)
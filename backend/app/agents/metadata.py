@@ -0,0 +1,125 @@
+"""Execution metadata and response types for GroundedCV agents.
+
+Kept free of claude_agent_sdk imports so metadata-only consumers do not pay
+the SDK import cost.
+"""
+
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from claude_agent_sdk import ResultMessage
+
+# Read-only per-token (input, output) USD rates, keyed by SDK alias and full
+# model ID. Pricing as of December 2024. See https://www.anthropic.com/pricing#anthropic-api
+# Keys are interned, as is AgentMetadata.model_used, so lookups resolve on
+# identity instead of comparing the strings character by character.
+_PRICING: MappingProxyType[str, tuple[float, float]] = MappingProxyType(
+    {
+        sys.intern(model): rates
+        for model, rates in {
+            "opus": (0.015 / 1000, 0.075 / 1000),
+            "sonnet": (0.003 / 1000, 0.015 / 1000),
+            "haiku": (0.001 / 1000, 0.005 / 1000),
+            "claude-opus-4-5-20251101": (0.015 / 1000, 0.075 / 1000),
+            "claude-sonnet-4-5-20250929": (0.003 / 1000, 0.015 / 1000),
+            "claude-haiku-4-5-20251001": (0.001 / 1000, 0.005 / 1000),
+        }.items()
+    }
+)
+
+# Prompt cache reads and writes are billed relative to the input rate
+_CACHE_READ_MULTIPLIER = 0.1
+_CACHE_WRITE_MULTIPLIER = 1.25
+
+
+@dataclass(slots=True)
+class AgentMetadata:
+    """Metadata about an agent execution."""
+
+    agent_name: str
+    model_used: str
+    tokens_in: int = 0
+    tokens_out: int = 0
+    latency_ms: int = 0
+    cost_usd: float = 0.0
+    started_at: datetime = field(default_factory=datetime.now)
+    completed_at: datetime | None = None
+    session_id: str | None = None
+    num_turns: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+
+    @classmethod
+    def from_result_message(
+        cls,
+        agent_name: str,
+        model: str,
+        result: "ResultMessage",
+        started_at: datetime,
+    ) -> "AgentMetadata":
+        """Create metadata from SDK ResultMessage.
+
+        Args:
+            agent_name: Name of the agent
+            model: Model used for the request
+            result: ResultMessage from claude-agent-sdk
+            started_at: When the request started
+
+        Returns:
+            AgentMetadata instance populated from the result
+        """
+        usage = result.usage
+        # Every field is set below, so skip the generated __init__ and
+        # its keyword handling and assign the slots directly.
+        metadata = object.__new__(cls)
+        metadata.agent_name = agent_name
+        metadata.model_used = sys.intern(model)
+        if usage:
+            metadata.tokens_in = usage.get("input_tokens", 0)
+            metadata.tokens_out = usage.get("output_tokens", 0)
+            metadata.cache_read_tokens = usage.get("cache_read_input_tokens", 0)
+            metadata.cache_creation_tokens = usage.get("cache_creation_input_tokens", 0)
+        else:
+            metadata.tokens_in = metadata.tokens_out = 0
+            metadata.cache_read_tokens = metadata.cache_creation_tokens = 0
+        metadata.latency_ms = result.duration_ms
+        metadata.cost_usd = result.total_cost_usd or 0.0
+        metadata.started_at = started_at
+        metadata.completed_at = started_at + timedelta(milliseconds=result.duration_ms)
+        metadata.session_id = result.session_id
+        metadata.num_turns = result.num_turns
+        return metadata
+
+    def calculate_cost(self) -> float:
+        """Calculate the cost based on model and tokens used.
+
+        This is a fallback method when SDK doesn't provide cost.
+        Uses Claude pricing as of the documentation date. Prompt cache
+        reads cost 0.1x and cache writes 1.25x the input rate.
+
+        Returns:
+            Calculated cost in USD
+        """
+        rates = _PRICING.get(self.model_used)
+        if rates is not None:
+            input_tokens = (
+                self.tokens_in
+                + self.cache_read_tokens * _CACHE_READ_MULTIPLIER
+                + self.cache_creation_tokens * _CACHE_WRITE_MULTIPLIER
+            )
+            self.cost_usd = input_tokens * rates[0] + self.tokens_out * rates[1]
+        return self.cost_usd
+
+
+@dataclass(slots=True)
+class AgentResponse:
+    """Response from an agent execution."""
+
+    status: Literal["success", "error", "partial"]
+    output: Any
+    metadata: AgentMetadata
+    errors: tuple[str, ...] = ()
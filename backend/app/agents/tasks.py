@@ -0,0 +1,147 @@
+"""Background execution of agent runs for GroundedCV.
+
+Lets a request handler hand an agent run off and return a task ID straight
+away instead of awaiting the LLM round-trip inline. Runs execute on the
+application's event loop, with at most ``settings.agent_pool_size`` running
+at once. State lives in process memory, so it is lost on restart; finished
+tasks are kept for ``settings.agent_task_retention`` seconds, up to
+``settings.agent_task_max_finished`` of them.
+"""
+
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from app.agents.metadata import AgentResponse
+from app.config import settings
+from app.utils.cache import TTLCache
+
+if TYPE_CHECKING:
+    from app.agents.base import BaseAgent
+
+
+@dataclass(slots=True)
+class AgentTask:
+    """State of a submitted agent run."""
+
+    task_id: str
+    agent_name: str
+    status: Literal["pending", "running", "done", "failed"] = "pending"
+    response: AgentResponse | None = None
+    error: str | None = None
+
+
+class AgentTaskQueue:
+    """Run agents in the background with bounded concurrency.
+
+    Example:
+        queue = AgentTaskQueue()
+        task_id = queue.submit(agent, job_description)
+        ...
+        task = await queue.wait(task_id)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        retention: float | None = None,
+        max_finished: int | None = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            max_concurrency: Maximum number of agent runs executing at once
+                (defaults to settings.agent_pool_size)
+            retention: Seconds a finished task stays retrievable
+                (defaults to settings.agent_task_retention)
+            max_finished: Maximum number of finished tasks kept; the oldest
+                are dropped first (defaults to settings.agent_task_max_finished)
+
+        Raises:
+            ValueError: If max_concurrency or max_finished is less than 1,
+                or retention is not positive
+        """
+        limit = max_concurrency if max_concurrency is not None else settings.agent_pool_size
+        if limit < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._semaphore = asyncio.Semaphore(limit)
+        # Pending and running tasks; moved to _finished once they complete
+        self._tasks: dict[str, AgentTask] = {}
+        self._handles: dict[str, asyncio.Task[None]] = {}
+        self._finished: TTLCache[str, AgentTask] = TTLCache(
+            maxsize=max_finished if max_finished is not None else settings.agent_task_max_finished,
+            ttl=retention if retention is not None else settings.agent_task_retention,
+        )
+
+    def submit(self, agent: "BaseAgent", *args: Any, **kwargs: Any) -> str:
+        """Schedule ``agent.run(*args, **kwargs)`` and return its task ID.
+
+        Must be called from within a running event loop.
+
+        Args:
+            agent: Agent to run
+            *args: Positional arguments for agent.run
+            **kwargs: Keyword arguments for agent.run
+
+        Returns:
+            ID for looking up the task with get() or wait()
+        """
+        task = AgentTask(task_id=uuid.uuid4().hex, agent_name=agent.name)
+        self._tasks[task.task_id] = task
+        self._handles[task.task_id] = asyncio.create_task(self._execute(task, agent, args, kwargs))
+        return task.task_id
+
+    def get(self, task_id: str) -> AgentTask | None:
+        """Return the current state of a task, or None if unknown or expired."""
+        task = self._tasks.get(task_id)
+        if task is None:
+            task = self._finished.get(task_id)
+        return task
+
+    async def wait(self, task_id: str) -> AgentTask:
+        """Wait for a task to finish and return its final state.
+
+        Raises:
+            KeyError: If the task ID is unknown or has expired
+        """
+        task = self.get(task_id)
+        if task is None:
+            raise KeyError(task_id)
+        handle = self._handles.get(task_id)
+        if handle is not None:
+            await asyncio.shield(handle)
+        return task
+
+    async def shutdown(self) -> None:
+        """Cancel unfinished tasks. Call on application shutdown."""
+        handles = list(self._handles.values())
+        for handle in handles:
+            handle.cancel()
+        await asyncio.gather(*handles, return_exceptions=True)
+        self._handles.clear()
+
+    async def _execute(
+        self,
+        task: AgentTask,
+        agent: "BaseAgent",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Run the agent under the concurrency limit and record the outcome."""
+        try:
+            async with self._semaphore:
+                task.status = "running"
+                task.response = await agent.run(*args, **kwargs)
+            task.status = "done"
+        except asyncio.CancelledError:
+            task.status = "failed"
+            task.error = "cancelled"
+            raise
+        except Exception as e:
+            task.status = "failed"
+            task.error = f"{type(e).__name__}: {e}"
+        finally:
+            self._handles.pop(task.task_id, None)
+            self._tasks.pop(task.task_id, None)
+            self._finished[task.task_id] = task
@@ -1,10 +1,20 @@
 """Configuration management for GroundedCV."""
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Settings field holding the model for each task complexity
+_MODEL_FIELDS = MappingProxyType(
+    {
+        "fast": "model_fast",
+        "balanced": "model_balanced",
+        "reasoning": "model_reasoning",
+    }
+)
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -41,7 +51,24 @@ class Settings(BaseSettings):
     max_iterations: int = 10
     quality_threshold: float = 0.8
     agent_pool_size: int = 5
+    agent_task_retention: float = 3600.0  # seconds a finished background task is kept
+    agent_task_max_finished: int = 1000
     ab_variant_count: int = 3
+    max_concurrent_llm: int = 8  # in-flight calls per _call_claude_many batch
+
+    # In-flight stateless calls per model tier, shared by all agents on an event loop
+    concurrency_fast: int = 16
+    concurrency_balanced: int = 8
+    concurrency_reasoning: int = 4
+
+    # Prompt caching (the Claude CLI caches system prompt + tool schema)
+    prompt_caching_enabled: bool = True
+
+    # Response cache (identical tool-free calls are answered locally); opt-in,
+    # since callers otherwise expect a freshly generated answer
+    response_cache_enabled: bool = False
+    response_cache_max: int = 256
+    response_cache_ttl: float = 3600.0  # seconds
 
     # Retry Configuration
     retry_max_attempts: int = 3
@@ -80,12 +107,8 @@ class Settings(BaseSettings):
 
     def get_model(self, complexity: Literal["fast", "balanced", "reasoning"]) -> str:
         """Get the appropriate model for task complexity."""
-        model_map = {
-            "fast": self.model_fast,
-            "balanced": self.model_balanced,
-            "reasoning": self.model_reasoning,
-        }
-        return model_map[complexity]
+        value: str = getattr(self, _MODEL_FIELDS[complexity])
+        return value
 
 
 # Global settings instance
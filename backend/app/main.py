@@ -1,43 +1,61 @@
 """GroundedCV FastAPI Application Entry Point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from rich.logging import RichHandler
 
+from app.agents.tasks import AgentTaskQueue
 from app.config import settings
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG if settings.debug else logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True)],
-)
 logger = logging.getLogger("grounded-cv")
 
 
+def _configure_logging() -> None:
+    """Route logging through Rich.
+
+    Called on startup rather than at import so that importing the app
+    (tests, tooling, reloader parents) does not pay for importing rich.
+    """
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.DEBUG if settings.debug else logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(rich_tracebacks=True)],
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
+    _configure_logging()
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Debug mode: {settings.debug}")
 
-    # Ensure data directories exist
-    settings.data_dir.mkdir(parents=True, exist_ok=True)
-    settings.master_resume_dir.mkdir(parents=True, exist_ok=True)
-    settings.market_research_dir.mkdir(parents=True, exist_ok=True)
-    settings.company_research_dir.mkdir(parents=True, exist_ok=True)
-    settings.base_resumes_dir.mkdir(parents=True, exist_ok=True)
-    settings.tailored_dir.mkdir(parents=True, exist_ok=True)
-    settings.templates_dir.mkdir(parents=True, exist_ok=True)
+    # Ensure data directories exist (off the event loop, concurrently)
+    data_dirs = (
+        settings.data_dir,
+        settings.master_resume_dir,
+        settings.market_research_dir,
+        settings.company_research_dir,
+        settings.base_resumes_dir,
+        settings.tailored_dir,
+        settings.templates_dir,
+    )
+    await asyncio.gather(*(asyncio.to_thread(path.mkdir, parents=True, exist_ok=True) for path in data_dirs))
+
+    # Background agent runs, shared by request handlers
+    app.state.agent_tasks = AgentTaskQueue()
 
     yield
 
     # Shutdown
     logger.info("Shutting down GroundedCV")
+    await app.state.agent_tasks.shutdown()
 
 
 # Create FastAPI app
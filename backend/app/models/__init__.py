@@ -9,6 +9,7 @@ from app.models.profile import Address, Profile
 from app.models.skills import Skill, Skills
 from app.models.validators import (
     parse_date_flexible,
+    validate_email,
     validate_github_url,
     validate_linkedin_url,
     validate_phone,
@@ -36,6 +37,7 @@ __all__ = [
     # Composite
     "MasterResume",
     # Validators
+    "validate_email",
     "validate_phone",
     "validate_linkedin_url",
     "validate_github_url",
@@ -5,12 +5,45 @@ import re
 from pathlib import Path
 from typing import ClassVar, Self
 
-from pydantic import Field, PrivateAttr, model_validator
+from pydantic import Field, PrivateAttr, TypeAdapter, model_validator
 
-from app.models.base import GroundedModel
+from app.models.base import GroundedModel, _write_text
 
 logger = logging.getLogger(__name__)
 
+# Metrics picked out of an achievement's result in one scan: percentages,
+# dollar amounts and multipliers
+_METRIC_RE = re.compile(r"\d+(?:\.\d+)?%|\$[\d,]+(?:\.\d{2})?[KMB]?|\d+[xX]")
+
+# achievements.md parsing: "### Title" starts an entry and "**Field:** text"
+# at the start of a line, optionally indented or bulleted, starts a field
+_STAR_FIELDS = ("situation", "task", "action", "result")
+_HEADING_RE = re.compile(r"###\s+")
+_MARKER_RE = re.compile(
+    r"\s*(?:[-*+]\s+)?\*\*(situation|task|action|result|keywords):\*\*\s*(.*)",
+    re.IGNORECASE,
+)
+
+
+def _star_entry(title: str, fields: dict[str, list[str]], keywords: list[str]) -> dict[str, str | list[str]] | None:
+    """Assemble one parsed achievement, or warn and return None if incomplete."""
+    data: dict[str, str | list[str]] = {"title": title}
+    for field, lines in fields.items():
+        if value := "\n".join(lines).strip():
+            data[field] = value
+    if keywords:
+        data["keywords"] = keywords
+
+    missing_fields = [f for f in _STAR_FIELDS if f not in data]
+    if missing_fields:
+        logger.warning(
+            "Skipping achievement section '%s': missing STAR component(s): %s",
+            title,
+            ", ".join(missing_fields),
+        )
+        return None
+    return data
+
 
 class Achievement(GroundedModel):
     """Single achievement in STAR format.
@@ -36,14 +69,7 @@ class Achievement(GroundedModel):
     def extract_metrics(self) -> Self:
         """Auto-extract metrics from result if not provided."""
         if not self.metrics:
-            # Find percentage patterns
-            percentages = re.findall(r"\d+(?:\.\d+)?%", self.result)
-            # Find dollar amounts
-            dollars = re.findall(r"\$[\d,]+(?:\.\d{2})?[KMB]?", self.result)
-            # Find multipliers
-            multipliers = re.findall(r"\d+[xX]", self.result)
-
-            self.metrics = percentages + dollars + multipliers
+            self.metrics = _METRIC_RE.findall(self.result)
         return self
 
     def to_bullet(self, max_length: int = 150) -> str:
@@ -55,10 +81,17 @@ class Achievement(GroundedModel):
         Returns:
             Condensed bullet point emphasizing action and result
         """
-        bullet = f"{self.action} {self.result}"
-        if len(bullet) > max_length:
-            bullet = bullet[: max_length - 3] + "..."
-        return bullet
+        action, result = self.action, self.result
+        if len(action) + 1 + len(result) <= max_length:
+            return f"{action} {result}"
+        # Slice only the part that survives truncation instead of building
+        # the whole bullet first
+        keep = max_length - 3
+        if keep < 0:
+            return f"{action} {result}"[:keep] + "..."
+        if keep <= len(action):
+            return action[:keep] + "..."
+        return f"{action} {result[: keep - len(action) - 1]}..."
 
     def to_markdown_section(self) -> str:
         """Convert to detailed Markdown format."""
@@ -74,6 +107,10 @@ class Achievement(GroundedModel):
         return "\n".join(lines)
 
 
+# Validates every parsed entry in one call instead of one model_validate each
+_ACHIEVEMENT_LIST = TypeAdapter(list[Achievement])
+
+
 class Achievements(GroundedModel):
     """Collection of STAR-formatted achievements.
 
@@ -87,6 +124,10 @@ class Achievements(GroundedModel):
     # Source tracking (not serialized)
     _source_file: Path | None = PrivateAttr(default=None)
 
+    def get_keywords(self) -> frozenset[str]:
+        """Get the keywords of every achievement."""
+        return frozenset().union(*(entry.keywords for entry in self.entries))
+
     def to_markdown(self) -> str:
         """Export all achievements to Markdown format."""
         sections = ["# Achievements\n"]
@@ -116,45 +157,52 @@ class Achievements(GroundedModel):
         Returns:
             Achievements instance
         """
-        achievements = []
-
-        # Split by achievement headers
-        sections = re.split(r"^###\s+", content, flags=re.MULTILINE)
-
-        for section in sections[1:]:  # Skip content before first ###
-            lines = section.strip().split("\n")
-            if not lines:
+        entries: list[dict[str, str | list[str]]] = []
+        title: str | None = None
+        fields: dict[str, list[str]] = {}
+        keywords: list[str] = []
+        current: list[str] | None = None  # lines of the field being read
+        keywords_pending = False  # keywords may follow on the next non-blank line
+
+        # Single pass over the lines; content before the first ### is skipped
+        for line in content.splitlines():
+            if heading := _HEADING_RE.match(line):
+                if title is not None and (entry := _star_entry(title, fields, keywords)):
+                    entries.append(entry)
+                title = line[heading.end() :].strip()
+                fields, keywords, current, keywords_pending = {}, [], None, False
+                continue
+            if title is None:
                 continue
 
-            title = lines[0].strip()
-            achievement_data: dict[str, str | list[str]] = {"title": title}
-
-            # Parse STAR components
-            text = "\n".join(lines[1:])
-
-            for field in ["situation", "task", "action", "result"]:
-                pattern = rf"\*\*{field.capitalize()}:\*\*\s*(.+?)(?=\*\*|\Z)"
-                if match := re.search(pattern, text, re.IGNORECASE | re.DOTALL):
-                    achievement_data[field] = match.group(1).strip()
-
-            # Parse keywords if present
-            if keywords_match := re.search(r"\*\*Keywords:\*\*\s*(.+?)(?=\n|$)", text, re.IGNORECASE):
-                keywords = [k.strip() for k in keywords_match.group(1).split(",")]
-                achievement_data["keywords"] = keywords
-
-            # Validate we have all required STAR fields
-            required_fields = ["situation", "task", "action", "result"]
-            missing_fields = [f for f in required_fields if f not in achievement_data]
+            if marker := _MARKER_RE.match(line):
+                name, line = marker.group(1).lower(), marker.group(2)
+                current = None
+                keywords_pending = False
+                if name == "keywords":
+                    keywords_pending = not keywords
+                elif name not in fields:  # first occurrence wins
+                    current = fields[name] = []
+
+            if keywords_pending:
+                if line.strip():
+                    keywords = [k.strip() for k in line.split(",")]
+                    keywords_pending = False
+                continue
+            if current is None:
+                continue
 
-            if missing_fields:
-                logger.warning(
-                    "Skipping achievement section '%s': missing STAR component(s): %s",
-                    title,
-                    ", ".join(missing_fields),
-                )
+            # Bold text ends a field, as does the next marker
+            if (end := line.find("**")) != -1:
+                current.append(line[:end])
+                current = None
             else:
-                achievements.append(Achievement.model_validate(achievement_data))
+                current.append(line)
+
+        if title is not None and (entry := _star_entry(title, fields, keywords)):
+            entries.append(entry)
 
+        achievements = _ACHIEVEMENT_LIST.validate_python(entries)
         instance = cls(entries=achievements)
         instance._source_file = source_file
         return instance
@@ -174,17 +222,7 @@ class Achievements(GroundedModel):
             PermissionError: If file cannot be read
             UnicodeDecodeError: If file encoding is invalid
         """
-        try:
-            content = file_path.read_text(encoding="utf-8")
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"Cannot load Achievements: file not found at '{file_path}'") from e
-        except PermissionError as e:
-            raise PermissionError(f"Cannot load Achievements: permission denied reading '{file_path}'") from e
-        except UnicodeDecodeError as e:
-            raise UnicodeDecodeError(
-                e.encoding, e.object, e.start, e.end, f"Cannot load Achievements: invalid encoding in '{file_path}'"
-            ) from e
-        return cls.from_markdown(content, source_file=file_path)
+        return cls._load_file(file_path, cls.from_markdown)
 
     def to_markdown_file(self, file_path: Path) -> None:
         """Save achievements to Markdown file.
@@ -197,7 +235,7 @@ class Achievements(GroundedModel):
             OSError: If write fails (disk full, etc.)
         """
         try:
-            file_path.write_text(self.to_markdown(), encoding="utf-8")
+            _write_text(file_path, self.to_markdown())
         except PermissionError as e:
             raise PermissionError(f"Cannot save Achievements: permission denied writing '{file_path}'") from e
         except OSError as e:
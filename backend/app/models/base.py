@@ -1,14 +1,93 @@
 """Base model with YAML/Markdown serialization for GroundedCV models."""
 
+import functools
+import types
+from collections.abc import Callable
+from datetime import date
 from pathlib import Path
-from typing import ClassVar, TypeVar
+from typing import Annotated, Any, ClassVar, TypeVar, Union, get_args, get_origin
 
 import yaml
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 
+# Prefer the libyaml C implementation; fall back to pure Python when PyYAML
+# was built without it
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 T = TypeVar("T", bound="GroundedModel")
 
 
+class _CompactDumper(_SafeDumper):
+    """Safe dumper that writes lists of short strings inline, e.g. [Python, Go]."""
+
+
+def _represent_list(dumper: _SafeDumper, data: list[Any]) -> yaml.SequenceNode:
+    """Represent a list in flow style when every item is a short string."""
+    inline = bool(data) and all(isinstance(item, str) and len(item) < 40 for item in data)
+    return dumper.represent_sequence("tag:yaml.org,2002:seq", data, flow_style=inline)
+
+
+_CompactDumper.add_representer(list, _represent_list)
+
+# Parsed files by (model class, path), with the (st_mtime_ns, st_size) they
+# were parsed at and whether they were validated. Callers always receive a
+# deep copy, never the cached object.
+_FILE_CACHE: dict[tuple[type, Path], tuple[int, int, bool, "GroundedModel"]] = {}
+
+
+def _trusted_converter(annotation: Any) -> Callable[[Any], Any] | None:
+    """Build a converter turning parsed YAML into a field value without validation.
+
+    Only nested models and dates need converting; every other value is used
+    as parsed. Converters pass through values they do not apply to.
+
+    Args:
+        annotation: Field type annotation
+
+    Returns:
+        Converter function, or None if values need no conversion
+    """
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _trusted_converter(get_args(annotation)[0])
+    if origin is list:
+        item = _trusted_converter(get_args(annotation)[0])
+        if item is None:
+            return None
+        return lambda v: [item(x) for x in v] if isinstance(v, list) else v
+    if origin is Union or origin is types.UnionType:
+        converters = [c for arg in get_args(annotation) if (c := _trusted_converter(arg)) is not None]
+        if not converters:
+            return None
+        return functools.reduce(lambda f, g: lambda v: g(f(v)), converters)
+    if isinstance(annotation, type) and issubclass(annotation, GroundedModel):
+        model = annotation
+        return lambda v: model._construct_trusted(v) if isinstance(v, dict) else v
+    if annotation is date:
+        return lambda v: date.fromisoformat(v) if isinstance(v, str) else v
+    return None
+
+
+@functools.cache
+def _trusted_converters(cls: type["GroundedModel"]) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    """Return (field name, converter) pairs for the fields of cls that need converting."""
+    return tuple(
+        (name, converter)
+        for name, field in cls.model_fields.items()
+        if (converter := _trusted_converter(field.annotation)) is not None
+    )
+
+
+def _write_text(file_path: Path, content: str) -> None:
+    """Write content to file_path as UTF-8. Patched by tests to simulate I/O errors."""
+    file_path.write_text(content, encoding="utf-8")
+
+
 class GroundedModel(BaseModel):
     """Base model with YAML serialization and source tracking.
 
@@ -39,43 +118,66 @@ class GroundedModel(BaseModel):
         """
         return yaml.dump(
             self.model_dump(mode="json", exclude_none=True),
+            Dumper=_CompactDumper,
             default_flow_style=False,
             allow_unicode=True,
             sort_keys=False,
+            width=120,
         )
 
     @classmethod
-    def from_yaml(cls: type[T], yaml_content: str, source_file: Path | None = None) -> T:
+    def _construct_trusted(cls: type[T], data: dict[str, Any]) -> T:
+        """Build an instance from trusted parsed data, skipping validation.
+
+        Nested models are constructed recursively and ISO date strings are
+        converted to dates; everything else is used as given.
+
+        Args:
+            data: Parsed data previously written by to_yaml
+
+        Returns:
+            Unvalidated model instance
+        """
+        values = dict(data)
+        for name, convert in _trusted_converters(cls):
+            if name in values:
+                values[name] = convert(values[name])
+        return cls.model_construct(**values)  # type: ignore[return-value]
+
+    @classmethod
+    def from_yaml(cls: type[T], yaml_content: str, source_file: Path | None = None, trusted: bool = False) -> T:
         """Import model from YAML string.
 
         Args:
             yaml_content: YAML string to parse
             source_file: Optional source file path for tracking
+            trusted: Skip validation; only for content written by to_yaml
 
         Returns:
-            Validated model instance
+            Model instance (validated unless trusted)
 
         Raises:
             ValueError: If YAML content is empty
             ValidationError: If content doesn't match model schema
         """
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=_SafeLoader)
         if data is None:
             source_context = f" from '{source_file}'" if source_file else ""
             raise ValueError(f"Cannot load {cls.__name__}{source_context}: YAML content is empty")
-        instance = cls.model_validate(data)
+        instance = cls._construct_trusted(data) if trusted else cls.model_validate(data)
         instance._source_file = source_file
         return instance
 
     @classmethod
-    def from_yaml_file(cls: type[T], file_path: Path) -> T:
+    def from_yaml_file(cls: type[T], file_path: Path, trusted: bool = False) -> T:
         """Load model from YAML file.
 
         Args:
             file_path: Path to YAML file
+            trusted: Skip validation; only for files written by to_yaml_file
 
         Returns:
-            Validated model instance with source tracking
+            Model instance (validated unless trusted) with source tracking
 
         Raises:
             FileNotFoundError: If file does not exist
@@ -83,7 +185,37 @@ class GroundedModel(BaseModel):
             UnicodeDecodeError: If file encoding is invalid
             ValueError: If file is empty
         """
+        if trusted:
+            return cls._load_file(file_path, functools.partial(cls.from_yaml, trusted=True), trusted=True)
+        return cls._load_file(file_path, cls.from_yaml)
+
+    @classmethod
+    def _load_file(cls: type[T], file_path: Path, parse: Callable[[str, Path], T], trusted: bool = False) -> T:
+        """Read and parse a file, reusing the last result while it is unchanged.
+
+        Unchanged means the same modification time and size as when it was
+        last parsed. A result parsed with trusted=True is only reused by
+        other trusted loads. The returned instance is a deep copy, so callers
+        may mutate it freely.
+
+        Args:
+            file_path: Path to the file
+            parse: Called as parse(content, file_path) on a cache miss
+            trusted: Whether parse skips validation
+
+        Returns:
+            Validated model instance with source tracking
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            PermissionError: If file cannot be read
+            UnicodeDecodeError: If file encoding is invalid
+        """
         try:
+            stat = file_path.stat()
+            cached = _FILE_CACHE.get((cls, file_path))
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size) and (cached[2] or trusted):
+                return cached[3].model_copy(deep=True)  # type: ignore[return-value]
             content = file_path.read_text(encoding="utf-8")
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Cannot load {cls.__name__}: file not found at '{file_path}'") from e
@@ -93,7 +225,9 @@ class GroundedModel(BaseModel):
             raise UnicodeDecodeError(
                 e.encoding, e.object, e.start, e.end, f"Cannot load {cls.__name__}: invalid encoding in '{file_path}'"
             ) from e
-        return cls.from_yaml(content, source_file=file_path)
+        instance = parse(content, file_path)
+        _FILE_CACHE[(cls, file_path)] = (stat.st_mtime_ns, stat.st_size, not trusted, instance.model_copy(deep=True))
+        return instance
 
     def to_yaml_file(self, file_path: Path) -> None:
         """Save model to YAML file.
@@ -106,7 +240,7 @@ class GroundedModel(BaseModel):
             OSError: If write fails (disk full, etc.)
         """
         try:
-            file_path.write_text(self.to_yaml(), encoding="utf-8")
+            _write_text(file_path, self.to_yaml())
         except PermissionError as e:
             raise PermissionError(
                 f"Cannot save {self.__class__.__name__}: permission denied writing '{file_path}'"
@@ -53,6 +53,11 @@ class Certification(GroundedModel):
         return self.expiration_date < date.today()
 
 
+def _graduation_key(degree: Degree) -> date:
+    """Sort key placing degrees without a graduation date last."""
+    return degree.graduation_date or date.min
+
+
 class Education(GroundedModel):
     """Collection of education and certifications.
 
@@ -66,15 +71,8 @@ class Education(GroundedModel):
 
     def get_most_recent_degree(self) -> Degree | None:
         """Get the most recent degree by graduation date."""
-        if not self.degrees:
-            return None
-        # Sort by graduation date, most recent first
-        sorted_degrees = sorted(
-            self.degrees,
-            key=lambda d: d.graduation_date or date.min,
-            reverse=True,
-        )
-        return sorted_degrees[0]
+        # Single scan; ties keep the earliest-listed degree
+        return max(self.degrees, key=_graduation_key, default=None)
 
     def get_active_certifications(self) -> list[Certification]:
         """Get non-expired certifications."""
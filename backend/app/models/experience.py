@@ -9,6 +9,11 @@ from app.models.base import GroundedModel
 from app.models.validators import parse_date_flexible
 
 
+def _months_between(start: date, end: date) -> int:
+    """Whole calendar months from start to end (days are ignored)."""
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+
 class ExperienceEntry(GroundedModel):
     """Single work experience entry."""
 
@@ -57,7 +62,10 @@ class ExperienceEntry(GroundedModel):
         this is a current position.
         """
         if self.end_date is None and not self.is_current:
-            self.is_current = True
+            # Set the field directly: assigning it would go through
+            # validate_assignment and run this model validator a second time
+            self.__dict__["is_current"] = True
+            self.__pydantic_fields_set__.add("is_current")
         if self.end_date and self.end_date < self.start_date:
             raise ValueError("end_date must be after start_date")
         return self
@@ -65,8 +73,7 @@ class ExperienceEntry(GroundedModel):
     @property
     def duration_months(self) -> int:
         """Calculate duration in months."""
-        end = self.end_date or date.today()
-        return (end.year - self.start_date.year) * 12 + (end.month - self.start_date.month)
+        return _months_between(self.start_date, self.end_date or date.today())
 
 
 class Experience(GroundedModel):
@@ -79,6 +86,10 @@ class Experience(GroundedModel):
 
     entries: list[ExperienceEntry] = Field(default_factory=list, description="Work history entries (most recent first)")
 
+    def get_keywords(self) -> frozenset[str]:
+        """Get the keywords of every entry."""
+        return frozenset().union(*(entry.keywords for entry in self.entries))
+
     def get_current_position(self) -> ExperienceEntry | None:
         """Get current position if any."""
         for entry in self.entries:
@@ -91,6 +102,24 @@ class Experience(GroundedModel):
         return [e for e in self.entries if company.lower() in e.company.lower()]
 
     def get_total_experience_years(self) -> float:
-        """Calculate total years of experience."""
-        total_months = sum(e.duration_months for e in self.entries)
+        """Calculate total years of experience.
+
+        Overlapping or back-to-back positions are merged first, so time
+        spent in concurrent roles is only counted once.
+        """
+        today = date.today()
+        intervals = sorted((e.start_date, e.end_date or today) for e in self.entries)
+
+        total_months = 0
+        span_start: date | None = None
+        span_end = today
+        for start, end in intervals:
+            if span_start is not None and start <= span_end:
+                span_end = max(span_end, end)
+                continue
+            if span_start is not None:
+                total_months += _months_between(span_start, span_end)
+            span_start, span_end = start, end
+        if span_start is not None:
+            total_months += _months_between(span_start, span_end)
         return round(total_months / 12, 1)
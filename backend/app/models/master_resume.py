@@ -1,5 +1,6 @@
 """Master Resume composite model."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import ClassVar
 
@@ -34,11 +35,17 @@ class MasterResume(GroundedModel):
     achievements: Achievements = Field(default_factory=Achievements)
 
     @classmethod
-    def from_directory(cls, directory: Path) -> "MasterResume":
+    def from_directory(cls, directory: Path, trusted: bool = False) -> "MasterResume":
         """Load Master Resume from directory structure.
 
+        Pass trusted=True on server startup to reload a directory written by
+        to_directory, which validates before writing; YAML components are
+        then built without re-validation. The default path validates
+        everything, as needed for hand-edited files.
+
         Args:
             directory: Path to master-resume directory
+            trusted: Skip validation of the YAML components
 
         Returns:
             MasterResume with all components loaded
@@ -51,30 +58,35 @@ class MasterResume(GroundedModel):
         profile_path = directory / "profile.yaml"
         if not profile_path.exists():
             raise FileNotFoundError(f"Required file not found: {profile_path}")
-        profile = Profile.from_yaml_file(profile_path)
 
-        # Other components are optional
-        experience = Experience()
+        # Components are independent files; read and parse them concurrently.
+        # File I/O and the libyaml parser release the GIL, so threads suffice.
         experience_path = directory / "experience.yaml"
-        if experience_path.exists():
-            experience = Experience.from_yaml_file(experience_path)
-
-        education = Education()
         education_path = directory / "education.yaml"
-        if education_path.exists():
-            education = Education.from_yaml_file(education_path)
-
-        skills = Skills()
         skills_path = directory / "skills.yaml"
-        if skills_path.exists():
-            skills = Skills.from_yaml_file(skills_path)
-
-        achievements = Achievements()
         achievements_path = directory / "achievements.md"
-        if achievements_path.exists():
-            achievements = Achievements.from_markdown_file(achievements_path)
-
-        return cls(
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            profile_future = pool.submit(Profile.from_yaml_file, profile_path, trusted)
+            experience_future = (
+                pool.submit(Experience.from_yaml_file, experience_path, trusted) if experience_path.exists() else None
+            )
+            education_future = (
+                pool.submit(Education.from_yaml_file, education_path, trusted) if education_path.exists() else None
+            )
+            skills_future = pool.submit(Skills.from_yaml_file, skills_path, trusted) if skills_path.exists() else None
+            achievements_future = (
+                pool.submit(Achievements.from_markdown_file, achievements_path) if achievements_path.exists() else None
+            )
+
+        # Profile is required; missing optional components default to empty
+        profile = profile_future.result()
+        experience = experience_future.result() if experience_future else Experience()
+        education = education_future.result() if education_future else Education()
+        skills = skills_future.result() if skills_future else Skills()
+        achievements = achievements_future.result() if achievements_future else Achievements()
+
+        # Components are already model instances; skip re-checking them
+        return cls.model_construct(
             profile=profile,
             experience=experience,
             education=education,
@@ -89,9 +101,16 @@ class MasterResume(GroundedModel):
         saves are NOT deleted, which may leave stale data if sections were
         cleared. Use shutil.rmtree(directory) first for a clean write.
 
+        The whole resume is validated before anything is written, so
+        directories it produces are safe to load with trusted=True.
+
         Args:
             directory: Target directory (will be created if not exists)
+
+        Raises:
+            ValidationError: If the resume was mutated into an invalid state
         """
+        self.model_validate(self.model_dump())
         directory.mkdir(parents=True, exist_ok=True)
 
         self.profile.to_yaml_file(directory / "profile.yaml")
@@ -102,13 +121,16 @@ class MasterResume(GroundedModel):
         if self.education.degrees or self.education.certifications:
             self.education.to_yaml_file(directory / "education.yaml")
 
-        if any(
-            [
-                self.skills.languages,
-                self.skills.frameworks,
-                self.skills.tools,
-                self.skills.soft_skills,
-            ]
+        skills = self.skills
+        if (
+            skills.languages
+            or skills.frameworks
+            or skills.tools
+            or skills.databases
+            or skills.cloud
+            or skills.soft_skills
+            or skills.domains
+            or skills.methodologies
         ):
             self.skills.to_yaml_file(directory / "skills.yaml")
 
@@ -117,20 +139,9 @@ class MasterResume(GroundedModel):
 
     def get_all_keywords(self) -> set[str]:
         """Extract all keywords for ATS matching."""
-        keywords: set[str] = set()
-
-        # From skills
-        keywords.update(self.skills.get_all_technical_skills())
+        keywords = set(self.skills.iter_technical_skills())
         keywords.update(self.skills.soft_skills)
-
-        # From experience
-        for exp in self.experience.entries:
-            keywords.update(exp.keywords)
-
-        # From achievements
-        for achievement in self.achievements.entries:
-            keywords.update(achievement.keywords)
-
+        keywords |= self.experience.get_keywords() | self.achievements.get_keywords()
         return keywords
 
     def validate_completeness(self) -> dict[str, list[str]]:
@@ -6,6 +6,7 @@ from pydantic import Field, field_validator
 
 from app.models.base import GroundedModel
 from app.models.validators import (
+    validate_email,
     validate_github_url,
     validate_linkedin_url,
     validate_phone,
@@ -32,7 +33,7 @@ class Profile(GroundedModel):
 
     # Required fields
     name: str = Field(..., min_length=1, description="Full legal name")
-    email: str = Field(..., pattern=r"^[\w\.\-\+]+@[\w\-]+\.[\w\-\.]+$")
+    email: str = Field(..., description="Contact email address")
 
     # Optional contact info
     phone: str | None = None
@@ -53,6 +54,11 @@ class Profile(GroundedModel):
     target_roles: list[str] = Field(default_factory=list)
     target_industries: list[str] = Field(default_factory=list)
 
+    @field_validator("email")
+    @classmethod
+    def validate_email_format(cls, v: str) -> str:
+        return validate_email(v)
+
     @field_validator("phone")
     @classmethod
     def validate_phone_format(cls, v: str | None) -> str | None:
@@ -1,8 +1,10 @@
 """Skills model for technical and soft skills inventory."""
 
+import itertools
+from collections.abc import Callable, Iterator
 from typing import Annotated, Any, ClassVar, Literal
 
-from pydantic import BeforeValidator, Field
+from pydantic import BeforeValidator, Field, PrivateAttr
 
 from app.models.base import GroundedModel
 
@@ -19,14 +21,25 @@ class Skill(GroundedModel):
     aliases: list[str] = Field(default_factory=list, description="Alternative names (e.g., 'JS' for 'JavaScript')")
 
 
+# Exact-type handlers for skill entries; a dict lookup on type(v) is cheaper
+# than a chain of isinstance checks for the common cases
+_SKILL_DISPATCH: dict[type, Callable[[Any], str | Skill]] = {
+    str: lambda v: v,
+    dict: Skill.model_validate,
+    Skill: lambda v: v,
+}
+
+
 def _normalize_skill(v: Any) -> str | Skill:
     """Normalize skill input to either string or Skill object."""
-    if isinstance(v, str):
+    normalize = _SKILL_DISPATCH.get(type(v))
+    if normalize is not None:
+        return normalize(v)
+    # Subclasses of the dispatched types
+    if isinstance(v, (str, Skill)):
         return v
     if isinstance(v, dict):
         return Skill.model_validate(v)
-    if isinstance(v, Skill):
-        return v
     raise ValueError(f"Invalid skill type: {type(v)}")
 
 
@@ -43,6 +56,10 @@ listed as strings for brevity, while detailed skills use the full Skill model.
 """
 
 
+# Skills fields holding technical skills
+_TECHNICAL_CATEGORIES = frozenset({"languages", "frameworks", "tools", "databases", "cloud"})
+
+
 class Skills(GroundedModel):
     """Categorized skills inventory.
 
@@ -70,43 +87,45 @@ class Skills(GroundedModel):
         description="Development methodologies (e.g., 'Agile', 'Scrum')",
     )
 
+    # Derived lookups; reset when a category is reassigned
+    _technical_skills: list[str] | None = PrivateAttr(default=None)
+    _search_index: list[tuple[str, str | Skill]] | None = PrivateAttr(default=None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _TECHNICAL_CATEGORIES:
+            self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """Drop cached lookups. Call after mutating a skill list in place."""
+        self._technical_skills = None
+        self._search_index = None
+
+    def iter_technical_skills(self) -> Iterator[str]:
+        """Yield the name of every technical skill, category by category."""
+        for skill in itertools.chain(self.languages, self.frameworks, self.tools, self.databases, self.cloud):
+            yield skill if isinstance(skill, str) else skill.name
+
     def get_all_technical_skills(self) -> list[str]:
         """Get flat list of all technical skill names."""
-        skills = []
-        for category in [
-            self.languages,
-            self.frameworks,
-            self.tools,
-            self.databases,
-            self.cloud,
-        ]:
-            for skill in category:
-                if isinstance(skill, str):
-                    skills.append(skill)
-                else:
-                    skills.append(skill.name)
-        return skills
+        if self._technical_skills is None:
+            self._technical_skills = list(self.iter_technical_skills())
+        return list(self._technical_skills)
 
     def search_skill(self, query: str) -> list[str | Skill]:
         """Find skills matching a query (including aliases)."""
+        if self._search_index is None:
+            self._search_index = self._build_search_index()
         query_lower = query.lower()
-        matches: list[str | Skill] = []
-
-        for category in [
-            self.languages,
-            self.frameworks,
-            self.tools,
-            self.databases,
-            self.cloud,
-        ]:
-            for skill in category:
-                if isinstance(skill, str):
-                    if query_lower in skill.lower():
-                        matches.append(skill)
-                else:
-                    if query_lower in skill.name.lower() or any(
-                        query_lower in alias.lower() for alias in skill.aliases
-                    ):
-                        matches.append(skill)
-
-        return matches
+        return [skill for keys, skill in self._search_index if query_lower in keys]
+
+    def _build_search_index(self) -> list[tuple[str, str | Skill]]:
+        """Pair each technical skill with its lowercased name and aliases.
+
+        Names and aliases are joined with NUL, which cannot occur in a
+        query, so one substring test checks them all.
+        """
+        return [
+            (skill.lower() if isinstance(skill, str) else "\0".join([skill.name, *skill.aliases]).lower(), skill)
+            for skill in itertools.chain(self.languages, self.frameworks, self.tools, self.databases, self.cloud)
+        ]
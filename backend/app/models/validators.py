@@ -2,10 +2,50 @@
 
 import re
 from datetime import date
-from urllib.parse import urlparse
 
 from pydantic_core import PydanticCustomError
 
+_EMAIL_RE = re.compile(r"^[\w.\-+]+@[\w\-]+\.[\w.\-]+\Z")
+_MONTH_NAMES = (
+    "january",
+    "february",
+    "march",
+    "april",
+    "may",
+    "june",
+    "july",
+    "august",
+    "september",
+    "october",
+    "november",
+    "december",
+)
+_MONTHS = {name: number for number, name in enumerate(_MONTH_NAMES, start=1)}
+_MONTHS.update({name[:3]: number for number, name in enumerate(_MONTH_NAMES, start=1)})
+_MONTHS["sept"] = 9
+
+
+def validate_email(value: str) -> str:
+    """Validate email address format.
+
+    Args:
+        value: Email address string
+
+    Returns:
+        Original email address (validated)
+
+    Raises:
+        PydanticCustomError: If email format is invalid
+    """
+    # Reject oversized or obviously malformed input before running the regex
+    if len(value) > 254 or "@" not in value or not _EMAIL_RE.match(value):
+        raise PydanticCustomError(
+            "email_format",
+            "Invalid email format. Expected: user@example.com",
+            {"value": value},
+        )
+    return value
+
 
 def validate_phone(value: str) -> str:
     """Validate phone number format.
@@ -24,17 +64,65 @@ def validate_phone(value: str) -> str:
     Raises:
         PydanticCustomError: If phone format is invalid
     """
-    # Remove whitespace and common separators for validation
-    cleaned = re.sub(r"[\s\-\(\)\.]", "", value)
+    # Single scan: skip whitespace and common separators; what remains must
+    # be 7-15 digits, optionally preceded by one +
+    digits = 0
+    plus_allowed = True
+    for char in value:
+        if char.isspace() or char in "-().":
+            continue
+        if char == "+" and plus_allowed:
+            plus_allowed = False
+        elif char.isdecimal():
+            plus_allowed = False
+            digits += 1
+        else:
+            break
+    else:
+        if 7 <= digits <= 15:
+            return value
 
-    # Must be digits, optionally starting with +
-    if not re.match(r"^\+?\d{7,15}$", cleaned):
-        raise PydanticCustomError(
-            "phone_format",
-            "Invalid phone number format. Expected: +1 (555) 123-4567",
-            {"value": value},
-        )
-    return value
+    raise PydanticCustomError(
+        "phone_format",
+        "Invalid phone number format. Expected: +1 (555) 123-4567",
+        {"value": value},
+    )
+
+
+def _split_url(url: str) -> tuple[str, str]:
+    """Split an absolute URL into its lowercased hostname and its path.
+
+    Userinfo and port are dropped from the host; query and fragment are
+    dropped from the path.
+
+    Args:
+        url: URL including a scheme, e.g. "https://github.com/user"
+
+    Returns:
+        (host, path) tuple
+    """
+    rest = url[url.find("://") + 3 :]
+    netloc_end = len(rest)
+    for separator in "/?#":
+        index = rest.find(separator, 0, netloc_end)
+        if index != -1:
+            netloc_end = index
+    path = rest[netloc_end:].partition("?")[0].partition("#")[0]
+    host = rest[:netloc_end].rpartition("@")[2].partition(":")[0].lower()
+    return host, path
+
+
+def _is_profile_path(path: str, prefix: str) -> bool:
+    """Check path is prefix + username with an optional trailing slash.
+
+    Usernames are word characters, hyphens and periods.
+    """
+    if not path.startswith(prefix):
+        return False
+    username = path[len(prefix) :]
+    if username.endswith("/"):
+        username = username[:-1]
+    return bool(username) and all(char.isalnum() or char in "_.-" for char in username)
 
 
 def validate_linkedin_url(value: str) -> str:
@@ -67,8 +155,7 @@ def validate_linkedin_url(value: str) -> str:
             value = f"https://linkedin.com/in/{value}"
 
     # Parse and validate the host
-    parsed = urlparse(value)
-    host = parsed.hostname or ""
+    host, path = _split_url(value)
 
     # Check exact match or subdomain of linkedin.com
     if host != "linkedin.com" and not host.endswith(".linkedin.com"):
@@ -79,7 +166,7 @@ def validate_linkedin_url(value: str) -> str:
         )
 
     # Validate path pattern (allow word chars, hyphens, and periods in usernames)
-    if not re.match(r"^/in/[\w\.\-]+/?$", parsed.path):
+    if not _is_profile_path(path, "/in/"):
         raise PydanticCustomError(
             "linkedin_url",
             "Invalid LinkedIn URL. Expected: linkedin.com/in/username",
@@ -118,8 +205,7 @@ def validate_github_url(value: str) -> str:
             value = f"https://github.com/{value}"
 
     # Parse and validate the host
-    parsed = urlparse(value)
-    host = parsed.hostname or ""
+    host, path = _split_url(value)
 
     # Check exact match or subdomain of github.com
     if host != "github.com" and not host.endswith(".github.com"):
@@ -130,7 +216,7 @@ def validate_github_url(value: str) -> str:
         )
 
     # Validate path pattern (username only, not repo paths; allow periods in usernames)
-    if not re.match(r"^/[\w\.\-]+/?$", parsed.path):
+    if not _is_profile_path(path, "/"):
         raise PydanticCustomError(
             "github_url",
             "Invalid GitHub URL. Expected: github.com/username",
@@ -148,7 +234,7 @@ def parse_date_flexible(value: str | date) -> date:
     - "YYYY-MM-DD"
     - "MM/YYYY"
     - "YYYY"
-    - "Month YYYY" (e.g., "January 2024")
+    - "Month YYYY" (e.g., "January 2024", "Jan 2024")
 
     Args:
         value: Date string or date object
@@ -164,39 +250,36 @@ def parse_date_flexible(value: str | date) -> date:
 
     value_str = value.strip()
 
-    # YYYY-MM-DD
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", value_str):
-        return date.fromisoformat(value_str)
-
-    # MM/YYYY
-    if match := re.match(r"^(\d{1,2})/(\d{4})$", value_str):
-        month, year = int(match.group(1)), int(match.group(2))
-        return date(year, month, 1)
+    # Dispatch on cheap shape checks instead of trying each format in turn
+    length = len(value_str)
 
     # YYYY only
-    if re.match(r"^\d{4}$", value_str):
+    if length == 4 and value_str.isdecimal():
         return date(int(value_str), 1, 1)
 
-    # Month YYYY
-    months = {
-        "january": 1,
-        "february": 2,
-        "march": 3,
-        "april": 4,
-        "may": 5,
-        "june": 6,
-        "july": 7,
-        "august": 8,
-        "september": 9,
-        "october": 10,
-        "november": 11,
-        "december": 12,
-    }
-    if match := re.match(r"^(\w+)\s+(\d{4})$", value_str, re.IGNORECASE):
-        month_name = match.group(1).lower()
-        year = int(match.group(2))
-        if month_name in months:
-            return date(year, months[month_name], 1)
+    # YYYY-MM-DD
+    if (
+        length == 10
+        and value_str[4] == "-"
+        and value_str[7] == "-"
+        and value_str[:4].isdecimal()
+        and value_str[5:7].isdecimal()
+        and value_str[8:].isdecimal()
+    ):
+        return date.fromisoformat(value_str)
+
+    # MM/YYYY
+    if "/" in value_str:
+        month_str, _, year_str = value_str.partition("/")
+        if 1 <= len(month_str) <= 2 and month_str.isdecimal() and len(year_str) == 4 and year_str.isdecimal():
+            return date(int(year_str), int(month_str), 1)
+    else:
+        # Month YYYY
+        parts = value_str.split()
+        if len(parts) == 2 and len(parts[1]) == 4 and parts[1].isdecimal():
+            month = _MONTHS.get(parts[0].lower())
+            if month is not None:
+                return date(int(parts[1]), month, 1)
 
     raise PydanticCustomError(
         "date_format",
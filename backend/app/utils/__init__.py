@@ -1,5 +1,6 @@
 """Utility Functions for GroundedCV."""
 
-from app.utils.retry import RetryConfig, retry_async_generator, retry_on_transient_error
+from app.utils.cache import TTLCache
+from app.utils.retry import RetryConfig, retry_async, retry_async_generator, retry_on_transient_error
 
-__all__ = ["RetryConfig", "retry_async_generator", "retry_on_transient_error"]
+__all__ = ["RetryConfig", "TTLCache", "retry_async", "retry_async_generator", "retry_on_transient_error"]
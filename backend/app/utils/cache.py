@@ -0,0 +1,72 @@
+"""In-process caching utilities."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, MutableMapping
+from typing import TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(MutableMapping[K, V]):
+    """Bounded mapping whose entries expire after a fixed time-to-live.
+
+    Least recently used entries are evicted once ``maxsize`` is reached.
+    Expired entries are dropped lazily when they are looked up, iterated
+    or counted. Not thread-safe; intended for use from a single
+    event loop.
+
+    Attributes:
+        maxsize: Maximum number of entries kept
+        ttl: Seconds an entry stays valid after it is stored
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid after it is stored
+
+        Raises:
+            ValueError: If maxsize < 1 or ttl <= 0
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def __getitem__(self, key: K) -> V:
+        value, expires_at = self._data[key]
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            raise KeyError(key)
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __delitem__(self, key: K) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[K]:
+        self._expire(time.monotonic())
+        return iter(list(self._data))
+
+    def __len__(self) -> int:
+        self._expire(time.monotonic())
+        return len(self._data)
+
+    def _expire(self, now: float) -> None:
+        """Drop every entry whose TTL has elapsed."""
+        expired = [key for key, (_, expires_at) in self._data.items() if now >= expires_at]
+        for key in expired:
+            del self._data[key]
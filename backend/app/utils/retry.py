@@ -2,10 +2,11 @@
 
 import asyncio
 import functools
+import inspect
 import logging
 import random
 from collections.abc import AsyncIterator, Awaitable, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ParamSpec, TypeVar
 
 P = ParamSpec("P")
@@ -25,6 +26,10 @@ class RetryConfig:
         max_delay: Maximum delay in seconds (caps exponential growth, after jitter)
         exponential_base: Base for exponential backoff calculation
         jitter: Whether to add randomization to delays (applied before max_delay cap)
+        total_timeout: Optional overall limit in seconds for retry_async,
+            covering every attempt and the sleeps between them
+
+    Delays are precomputed on construction, so treat instances as immutable.
     """
 
     max_attempts: int = 3
@@ -32,6 +37,8 @@ class RetryConfig:
     max_delay: float = 30.0
     exponential_base: float = 2.0
     jitter: bool = True
+    total_timeout: float | None = None
+    _delays: list[float] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate configuration values."""
@@ -43,6 +50,17 @@ class RetryConfig:
             raise ValueError("max_delay must be >= 0")
         if self.exponential_base < 1:
             raise ValueError("exponential_base must be >= 1")
+        if self.total_timeout is not None and self.total_timeout <= 0:
+            raise ValueError("total_timeout must be > 0")
+
+        # Uncapped delay per attempt. Stop once even the lowest jitter factor
+        # (0.5x) reaches max_delay, which also keeps the power from overflowing
+        self._delays = []
+        for attempt in range(self.max_attempts):
+            delay = self.base_delay * (self.exponential_base**attempt)
+            self._delays.append(delay)
+            if delay * 0.5 >= self.max_delay:
+                break
 
     def calculate_delay(self, attempt: int) -> float:
         """Calculate delay for a given attempt number (0-indexed).
@@ -53,7 +71,13 @@ class RetryConfig:
         Returns:
             Delay in seconds before next retry
         """
-        delay = self.base_delay * (self.exponential_base**attempt)
+        if attempt < len(self._delays):
+            delay = self._delays[attempt]
+        elif self._delays[-1] * 0.5 >= self.max_delay:
+            # Saturated: every later attempt waits max_delay
+            return self.max_delay
+        else:
+            delay = self.base_delay * (self.exponential_base**attempt)
         if self.jitter:
             # Add jitter: 0.5x to 1.5x of calculated delay (applied before cap)
             delay = delay * (0.5 + random.random())
@@ -62,6 +86,71 @@ class RetryConfig:
         return delay
 
 
+async def retry_async(
+    func: Callable[[], Awaitable[T]],
+    retryable_exceptions: tuple[type[Exception], ...],
+    config: RetryConfig | None = None,
+    logger: logging.Logger | None = None,
+) -> T:
+    """Await a coroutine factory, retrying on transient errors.
+
+    Args:
+        func: Zero-argument callable returning a fresh awaitable per attempt
+        retryable_exceptions: Tuple of exception types to retry on
+        config: RetryConfig instance (uses defaults if None)
+        logger: Logger for retry messages (uses module logger if None)
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        The last exception after all retries are exhausted or the
+        total_timeout deadline passes, or any non-retryable exception
+        immediately. TimeoutError if an attempt is still running at the
+        deadline.
+
+    Example:
+        result = await retry_async(
+            lambda: fetch(url),
+            retryable_exceptions=(ConnectionError,),
+            config=RetryConfig(max_attempts=3),
+        )
+    """
+    if config is None:
+        config = RetryConfig()
+
+    log = logger or _logger
+    final_attempt = config.max_attempts - 1
+    loop = asyncio.get_running_loop()
+    deadline = None if config.total_timeout is None else loop.time() + config.total_timeout
+
+    def run() -> Awaitable[T]:
+        if deadline is None:
+            return func()
+        return asyncio.wait_for(func(), deadline - loop.time())
+
+    for attempt in range(final_attempt):
+        try:
+            return await run()
+        except retryable_exceptions as e:
+            delay = config.calculate_delay(attempt)
+            # No time would be left for another attempt after sleeping
+            if deadline is not None and loop.time() + delay >= deadline:
+                raise
+            log.warning(
+                "Attempt %d/%d failed: %s: %s. Retrying in %.2fs",
+                attempt + 1,
+                config.max_attempts,
+                type(e).__name__,
+                e,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    # Last attempt: let any exception propagate as-is
+    return await run()
+
+
 def retry_on_transient_error(
     retryable_exceptions: tuple[type[Exception], ...],
     config: RetryConfig | None = None,
@@ -93,28 +182,7 @@ def retry_on_transient_error(
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            last_exception: Exception | None = None
-
-            for attempt in range(config.max_attempts):
-                try:
-                    return await func(*args, **kwargs)
-                except retryable_exceptions as e:
-                    last_exception = e
-                    if attempt < config.max_attempts - 1:
-                        delay = config.calculate_delay(attempt)
-                        log.warning(
-                            f"Attempt {attempt + 1}/{config.max_attempts} failed: "
-                            f"{type(e).__name__}: {e}. Retrying in {delay:.2f}s"
-                        )
-                        await asyncio.sleep(delay)
-                    # If this was the last attempt, fall through to raise
-
-            # All retries exhausted
-            if last_exception is not None:
-                raise last_exception
-
-            # Should never reach here, but satisfy type checker
-            raise RuntimeError("Unexpected state in retry logic")
+            return await retry_async(lambda: func(*args, **kwargs), retryable_exceptions, config, log)
 
         return wrapper
 
@@ -158,7 +226,10 @@ async def retry_async_generator(
         config = RetryConfig()
 
     log = logger or _logger
-    last_exception: Exception | None = None
+    final_attempt = config.max_attempts - 1
+    # Async generator functions always return closable generators; other
+    # factories are probed once, on the first iterator they return
+    closable: bool | None = True if inspect.isasyncgenfunction(generator_factory) else None
 
     for attempt in range(config.max_attempts):
         gen: AsyncIterator[T] | None = None
@@ -174,30 +245,32 @@ async def retry_async_generator(
             return
 
         except retryable_exceptions as e:
-            # Only retry if we haven't yielded anything yet
-            if first_yielded:
-                # Mid-stream failure - do not retry to avoid duplicates
+            # Mid-stream failures are not retried to avoid duplicates, and
+            # the last attempt's failure propagates as-is
+            if first_yielded or attempt == final_attempt:
                 raise
 
-            last_exception = e
-            if attempt < config.max_attempts - 1:
-                delay = config.calculate_delay(attempt)
-                log.warning(
-                    f"Attempt {attempt + 1}/{config.max_attempts} failed: "
-                    f"{type(e).__name__}: {e}. Retrying in {delay:.2f}s"
-                )
-                await asyncio.sleep(delay)
-            # If this was the last attempt, fall through to raise
+            delay = config.calculate_delay(attempt)
+            log.warning(
+                "Attempt %d/%d failed: %s: %s. Retrying in %.2fs",
+                attempt + 1,
+                config.max_attempts,
+                type(e).__name__,
+                e,
+                delay,
+            )
+            await asyncio.sleep(delay)
         finally:
             # Ensure inner generator is properly closed
-            if gen is not None and hasattr(gen, "aclose"):
-                try:
-                    await gen.aclose()
-                except (GeneratorExit, StopAsyncIteration, RuntimeError):
-                    pass  # Expected during cleanup
-                except Exception as cleanup_error:
-                    log.warning(f"Unexpected error during generator cleanup: {cleanup_error}")
-
-    # All retries exhausted
-    if last_exception is not None:
-        raise last_exception
+            if gen is not None:
+                if closable is None:
+                    closable = hasattr(gen, "aclose")
+                if closable:
+                    try:
+                        await gen.aclose()  # type: ignore[attr-defined]
+                    except (GeneratorExit, StopAsyncIteration, RuntimeError):
+                        pass  # Expected during cleanup
+                    except Exception as cleanup_error:
+                        # Never let a cleanup failure replace the exception
+                        # that ended the attempt
+                        log.warning("Unexpected error during generator cleanup: %s", cleanup_error)
@@ -19,7 +19,15 @@ def mock_settings():
         mock.model_reasoning = "claude-opus-4-5-20251101"
         mock.max_tokens = 4096
         mock.max_iterations = 10
+        mock.max_concurrent_llm = 8
+        mock.concurrency_fast = 16
+        mock.concurrency_balanced = 8
+        mock.concurrency_reasoning = 4
         mock.data_dir = Path("./data")
+        mock.prompt_caching_enabled = True
+        mock.response_cache_enabled = False
+        mock.response_cache_max = 16
+        mock.response_cache_ttl = 60.0
         # Retry configuration
         mock.retry_max_attempts = 3
         mock.retry_base_delay = 0.01  # Fast for tests
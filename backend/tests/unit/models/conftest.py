@@ -1,11 +1,37 @@
 """Fixtures for model tests."""
 
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_file_cache():
+    """Start and finish each test with no cached file loads."""
+    from app.models.base import _FILE_CACHE
+
+    _FILE_CACHE.clear()
+    yield
+    _FILE_CACHE.clear()
+
+
+@pytest.fixture
+def fail_writes(monkeypatch):
+    """Make model file writes raise an error.
+
+    Call as fail_writes(module, error), where module is the dotted path of
+    the model module whose _write_text should raise error.
+    """
+
+    def install(module: str, error: OSError) -> None:
+        def write(file_path: Path, content: str) -> None:
+            raise error
+
+        monkeypatch.setattr(f"{module}._write_text", write)
+
+    return install
+
+
 @pytest.fixture
 def sample_profile_data() -> dict:
     """Valid profile data."""
@@ -91,13 +117,12 @@ def sample_achievement_data() -> dict:
 
 
 @pytest.fixture
-def temp_directory():
-    """Temporary directory for file tests."""
-    with TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+def temp_directory(tmp_path: Path) -> Path:
+    """Temporary directory for file tests (pytest's per-test tmp_path)."""
+    return tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_achievements_markdown() -> str:
     """Sample achievements in Markdown format."""
     return """# Achievements
@@ -116,3 +141,11 @@ def sample_achievements_markdown() -> str:
 **Result:** Reduced cloud costs by $50K monthly, a 35% savings
 **Keywords:** Cost Optimization, AWS, Infrastructure
 """
+
+
+@pytest.fixture(scope="session")
+def parsed_sample_achievements(sample_achievements_markdown: str):
+    """Sample achievements parsed once per session. Shared; do not mutate."""
+    from app.models.achievement import Achievements
+
+    return Achievements.from_markdown(sample_achievements_markdown)
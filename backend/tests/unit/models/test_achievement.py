@@ -15,28 +15,11 @@ class TestAchievementValidation:
         assert achievement.title == "Platform Migration Success"
         assert achievement.situation == sample_achievement_data["situation"]
 
-    def test_missing_required_situation(self, sample_achievement_data):
-        """Test situation is required."""
-        del sample_achievement_data["situation"]
-        with pytest.raises(ValidationError, match="situation"):
-            Achievement(**sample_achievement_data)
-
-    def test_missing_required_task(self, sample_achievement_data):
-        """Test task is required."""
-        del sample_achievement_data["task"]
-        with pytest.raises(ValidationError, match="task"):
-            Achievement(**sample_achievement_data)
-
-    def test_missing_required_action(self, sample_achievement_data):
-        """Test action is required."""
-        del sample_achievement_data["action"]
-        with pytest.raises(ValidationError, match="action"):
-            Achievement(**sample_achievement_data)
-
-    def test_missing_required_result(self, sample_achievement_data):
-        """Test result is required."""
-        del sample_achievement_data["result"]
-        with pytest.raises(ValidationError, match="result"):
+    @pytest.mark.parametrize("missing", ["situation", "task", "action", "result"])
+    def test_missing_required_field(self, sample_achievement_data, missing):
+        """Test each STAR field is required."""
+        del sample_achievement_data[missing]
+        with pytest.raises(ValidationError, match=missing):
             Achievement(**sample_achievement_data)
 
     def test_auto_extract_percentage_metrics(self):
@@ -71,6 +54,16 @@ class TestAchievementValidation:
         )
         assert "5x" in achievement.metrics
 
+    def test_extracted_metrics_follow_result_order(self):
+        """Test mixed metrics are listed in the order they appear."""
+        achievement = Achievement(
+            situation="Issue",
+            task="Fix",
+            action="Fixed",
+            result="Saved $2M, a 3x gain and 40% less churn",
+        )
+        assert achievement.metrics == ["$2M", "3x", "40%"]
+
     def test_preserve_provided_metrics(self):
         """Test provided metrics are not overwritten."""
         achievement = Achievement(
@@ -106,6 +99,12 @@ class TestAchievementMethods:
         assert len(bullet) == 50
         assert bullet.endswith("...")
 
+    def test_to_bullet_truncation_within_action(self):
+        """Test a limit shorter than the action cuts the action and drops the result."""
+        achievement = Achievement(situation="S", task="T", action="Shipped the new platform", result="Saved 30%")
+        assert achievement.to_bullet(max_length=10) == "Shipped..."
+        assert achievement.to_bullet(max_length=34) == "Shipped the new platform Saved 30%"
+
     def test_to_markdown_section(self, sample_achievement_data):
         """Test converting to Markdown section."""
         achievement = Achievement(**sample_achievement_data)
@@ -129,7 +128,9 @@ class TestAchievements:
 
     def test_to_markdown(self, sample_achievement_data):
         """Test exporting to Markdown format."""
-        achievements = Achievements(entries=[Achievement(**sample_achievement_data)])
+        # Export is under test, not validation or metric extraction, so skip both
+        achievement = Achievement.model_construct(**sample_achievement_data, metrics=[])
+        achievements = Achievements.model_construct(entries=[achievement])
         md = achievements.to_markdown()
 
         assert "# Achievements" in md
@@ -144,9 +145,69 @@ class TestAchievements:
         assert achievements.entries[1].title == "Cost Optimization"
         assert "Architecture" in achievements.entries[0].keywords
 
+    def test_from_markdown_multiline_fields(self):
+        """Test fields spanning several lines are kept whole and markers are case-insensitive."""
+        content = """# Achievements
+Preamble that is not an achievement.
+
+### Multi-line
+**situation:** First line
+second line
+
+**TASK:** Own the rollout
+**Action:** Shipped it
+**Result:** Cut costs by 20%
+**Keywords:** Delivery, Cost
+"""
+        achievements = Achievements.from_markdown(content)
+
+        assert len(achievements.entries) == 1
+        entry = achievements.entries[0]
+        assert entry.situation == "First line\nsecond line"
+        assert entry.task == "Own the rollout"
+        assert entry.keywords == ["Delivery", "Cost"]
+        assert entry.metrics == ["20%"]
+
+    def test_from_markdown_bulleted_and_indented_markers(self):
+        """Test markers written as list items or indented are recognized."""
+        content = """### Bulleted
+- **Situation:** Legacy monolith
+  continued here
+* **Task:** Split it up
+  **Action:** Extracted services
++ **Result:** Deploys 3x faster
+- **Keywords:** Microservices, Delivery
+"""
+        achievements = Achievements.from_markdown(content)
+
+        assert len(achievements.entries) == 1
+        entry = achievements.entries[0]
+        assert entry.situation == "Legacy monolith\n  continued here"
+        assert entry.task == "Split it up"
+        assert entry.action == "Extracted services"
+        assert entry.result == "Deploys 3x faster"
+        assert entry.keywords == ["Microservices", "Delivery"]
+
+    def test_from_markdown_keywords_on_next_line(self):
+        """Test keywords written on the line after the marker are kept."""
+        content = """### Next-line keywords
+**Situation:** S
+**Task:** T
+**Action:** A
+**Result:** R
+**Keywords:**
+
+Python, AWS
+"""
+        achievements = Achievements.from_markdown(content)
+
+        assert achievements.entries[0].keywords == ["Python", "AWS"]
+
     def test_markdown_roundtrip(self, sample_achievement_data, temp_directory):
         """Test achievements survive Markdown round-trip."""
-        original = Achievements(entries=[Achievement(**sample_achievement_data)])
+        # Only the written and re-parsed output is checked, so build unvalidated
+        achievement = Achievement.model_construct(**sample_achievement_data, metrics=[])
+        original = Achievements.model_construct(entries=[achievement])
 
         md_path = temp_directory / "achievements.md"
         original.to_markdown_file(md_path)
@@ -157,24 +218,29 @@ class TestAchievements:
         assert loaded.entries[0].title == sample_achievement_data["title"]
         assert loaded.entries[0].situation == sample_achievement_data["situation"]
 
-    def test_get_by_keyword(self, sample_achievements_markdown):
+    def test_get_by_keyword(self, parsed_sample_achievements):
         """Test filtering achievements by keyword."""
-        achievements = Achievements.from_markdown(sample_achievements_markdown)
-
-        arch_results = achievements.get_by_keyword("Architecture")
+        arch_results = parsed_sample_achievements.get_by_keyword("Architecture")
         assert len(arch_results) == 1
         assert arch_results[0].title == "Platform Migration Success"
 
-        aws_results = achievements.get_by_keyword("AWS")
+        aws_results = parsed_sample_achievements.get_by_keyword("AWS")
         assert len(aws_results) == 1
         assert aws_results[0].title == "Cost Optimization"
 
-    def test_get_by_keyword_case_insensitive(self, sample_achievements_markdown):
+    def test_get_by_keyword_case_insensitive(self, parsed_sample_achievements):
         """Test keyword search is case insensitive."""
-        achievements = Achievements.from_markdown(sample_achievements_markdown)
-        results = achievements.get_by_keyword("leadership")
+        results = parsed_sample_achievements.get_by_keyword("leadership")
         assert len(results) == 1
 
+    def test_get_keywords_reflects_entry_changes(self, sample_achievement_data):
+        """Test keywords follow entries mutated in place."""
+        achievements = Achievements(entries=[Achievement(**sample_achievement_data)])
+        assert "Rust" not in achievements.get_keywords()
+
+        achievements.entries[0].keywords.append("Rust")
+        assert "Rust" in achievements.get_keywords()
+
     def test_source_tracking(self, sample_achievements_markdown, temp_directory):
         """Test source file is tracked."""
         md_path = temp_directory / "achievements.md"
@@ -194,7 +260,7 @@ class TestAchievements:
 **Situation:** Only situation provided
 **Task:** Only task provided
 """
-        with caplog.at_level(logging.WARNING):
+        with caplog.at_level(logging.WARNING, logger="app.models.achievement"):
             achievements = Achievements.from_markdown(incomplete_md)
 
         # Entry should be skipped
@@ -223,7 +289,7 @@ class TestAchievements:
 **Task:** Task
 **Action:** Action
 """
-        with caplog.at_level(logging.WARNING):
+        with caplog.at_level(logging.WARNING, logger="app.models.achievement"):
             achievements = Achievements.from_markdown(mixed_md)
 
         # Only complete entry should be parsed
@@ -251,40 +317,33 @@ class TestAchievementsFileErrorHandling:
         with pytest.raises(FileNotFoundError, match="missing.md"):
             Achievements.from_markdown_file(missing_file)
 
-    def test_markdown_write_permission_error_includes_model_name(self, temp_directory, sample_achievement_data):
+    def test_markdown_write_permission_error_includes_model_name(
+        self, temp_directory, sample_achievement_data, fail_writes
+    ):
         """Test PermissionError includes model name on write."""
-        from pathlib import Path
-        from unittest.mock import patch
-
         achievements = Achievements(entries=[Achievement(**sample_achievement_data)])
         md_path = temp_directory / "test.md"
 
-        with patch.object(Path, "write_text", side_effect=PermissionError("Access denied")):
-            with pytest.raises(PermissionError, match="Achievements"):
-                achievements.to_markdown_file(md_path)
+        fail_writes("app.models.achievement", PermissionError("Access denied"))
+        with pytest.raises(PermissionError, match="Achievements"):
+            achievements.to_markdown_file(md_path)
 
-    def test_markdown_write_permission_error_includes_path(self, temp_directory, sample_achievement_data):
+    def test_markdown_write_permission_error_includes_path(self, temp_directory, sample_achievement_data, fail_writes):
         """Test PermissionError includes file path on write."""
-        from pathlib import Path
-        from unittest.mock import patch
-
         achievements = Achievements(entries=[Achievement(**sample_achievement_data)])
         md_path = temp_directory / "test.md"
 
-        with patch.object(Path, "write_text", side_effect=PermissionError("Access denied")):
-            with pytest.raises(PermissionError, match="test.md"):
-                achievements.to_markdown_file(md_path)
+        fail_writes("app.models.achievement", PermissionError("Access denied"))
+        with pytest.raises(PermissionError, match="test.md"):
+            achievements.to_markdown_file(md_path)
 
-    def test_markdown_write_oserror_includes_context(self, temp_directory, sample_achievement_data):
+    def test_markdown_write_oserror_includes_context(self, temp_directory, sample_achievement_data, fail_writes):
         """Test OSError includes model name and path on write."""
-        from pathlib import Path
-        from unittest.mock import patch
-
         achievements = Achievements(entries=[Achievement(**sample_achievement_data)])
         md_path = temp_directory / "test.md"
 
         error = OSError("Disk full")
         error.strerror = "No space left on device"
-        with patch.object(Path, "write_text", side_effect=error):
-            with pytest.raises(OSError, match="Achievements"):
-                achievements.to_markdown_file(md_path)
+        fail_writes("app.models.achievement", error)
+        with pytest.raises(OSError, match="Achievements"):
+            achievements.to_markdown_file(md_path)
@@ -43,6 +43,50 @@ class TestYamlErrorHandling:
             Profile.from_yaml_file(missing_file)
 
 
+class TestFileCache:
+    """Tests for reusing parsed files while they are unchanged."""
+
+    def test_unchanged_file_served_from_cache(self, temp_directory, sample_profile_data):
+        """Test a second load skips reading and returns an independent copy."""
+        from pathlib import Path
+        from unittest.mock import patch
+
+        yaml_path = temp_directory / "profile.yaml"
+        Profile(**sample_profile_data).to_yaml_file(yaml_path)
+
+        first = Profile.from_yaml_file(yaml_path)
+        with patch.object(Path, "read_text", side_effect=AssertionError("file re-read")):
+            second = Profile.from_yaml_file(yaml_path)
+
+        assert second == first
+        assert second is not first
+        assert second.get_source_file() == yaml_path
+        second.target_roles.append("CTO")
+        assert "CTO" not in Profile.from_yaml_file(yaml_path).target_roles
+
+    def test_modified_file_is_reparsed(self, temp_directory, sample_profile_data):
+        """Test a file whose size or mtime changed is parsed again."""
+        yaml_path = temp_directory / "profile.yaml"
+        Profile(**sample_profile_data).to_yaml_file(yaml_path)
+        Profile.from_yaml_file(yaml_path)
+
+        Profile(**{**sample_profile_data, "name": "Jane Q. Developer"}).to_yaml_file(yaml_path)
+
+        assert Profile.from_yaml_file(yaml_path).name == "Jane Q. Developer"
+
+
+class TestYamlLayout:
+    """Tests for the YAML written by to_yaml."""
+
+    def test_short_string_lists_written_inline(self, sample_profile_data):
+        """Test lists of short strings use flow style and still round-trip."""
+        profile = Profile(**sample_profile_data)
+        yaml_output = profile.to_yaml()
+
+        assert "target_roles: [Staff Engineer, Tech Lead]" in yaml_output
+        assert Profile.from_yaml(yaml_output) == profile
+
+
 class TestWhitespaceValidation:
     """Tests for whitespace-only string validation."""
 
@@ -57,52 +101,40 @@ class TestWhitespaceValidation:
         assert profile.name == "Jane"
 
 
+@pytest.fixture(scope="class")
+def trivial_profile() -> Profile:
+    """Profile shared per test class; built without validation since only writing is tested."""
+    return Profile.model_construct(name="Test", email="test@example.com")
+
+
 class TestWriteErrorHandling:
     """Tests for write operation error scenarios."""
 
-    def test_yaml_write_permission_error_includes_class_name(self, temp_directory):
+    def test_yaml_write_permission_error_includes_class_name(self, temp_directory, fail_writes, trivial_profile):
         """Test PermissionError includes class name."""
-        from pathlib import Path
-        from unittest.mock import patch
-
-        from app.models.profile import Profile
-
-        profile = Profile(name="Test", email="test@example.com")
         yaml_path = temp_directory / "test.yaml"
 
-        with patch.object(Path, "write_text", side_effect=PermissionError("Access denied")):
-            with pytest.raises(PermissionError, match="Profile"):
-                profile.to_yaml_file(yaml_path)
+        fail_writes("app.models.base", PermissionError("Access denied"))
+        with pytest.raises(PermissionError, match="Profile"):
+            trivial_profile.to_yaml_file(yaml_path)
 
-    def test_yaml_write_permission_error_includes_path(self, temp_directory):
+    def test_yaml_write_permission_error_includes_path(self, temp_directory, fail_writes, trivial_profile):
         """Test PermissionError includes file path."""
-        from pathlib import Path
-        from unittest.mock import patch
-
-        from app.models.profile import Profile
-
-        profile = Profile(name="Test", email="test@example.com")
         yaml_path = temp_directory / "test.yaml"
 
-        with patch.object(Path, "write_text", side_effect=PermissionError("Access denied")):
-            with pytest.raises(PermissionError, match="test.yaml"):
-                profile.to_yaml_file(yaml_path)
+        fail_writes("app.models.base", PermissionError("Access denied"))
+        with pytest.raises(PermissionError, match="test.yaml"):
+            trivial_profile.to_yaml_file(yaml_path)
 
-    def test_yaml_write_oserror_includes_context(self, temp_directory):
+    def test_yaml_write_oserror_includes_context(self, temp_directory, fail_writes, trivial_profile):
         """Test OSError includes class name and path."""
-        from pathlib import Path
-        from unittest.mock import patch
-
-        from app.models.profile import Profile
-
-        profile = Profile(name="Test", email="test@example.com")
         yaml_path = temp_directory / "test.yaml"
 
         error = OSError("Disk full")
         error.strerror = "No space left on device"
-        with patch.object(Path, "write_text", side_effect=error):
-            with pytest.raises(OSError, match="Profile"):
-                profile.to_yaml_file(yaml_path)
+        fail_writes("app.models.base", error)
+        with pytest.raises(OSError, match="Profile"):
+            trivial_profile.to_yaml_file(yaml_path)
 
 
 class TestAddressValidation:
@@ -17,16 +17,11 @@ class TestDegreeValidation:
         assert degree.degree == "BS Computer Science"
         assert degree.institution == "State University"
 
-    def test_missing_required_degree(self, sample_degree_data):
-        """Test degree name is required."""
-        del sample_degree_data["degree"]
-        with pytest.raises(ValidationError, match="degree"):
-            Degree(**sample_degree_data)
-
-    def test_missing_required_institution(self, sample_degree_data):
-        """Test institution is required."""
-        del sample_degree_data["institution"]
-        with pytest.raises(ValidationError, match="institution"):
+    @pytest.mark.parametrize("missing", ["degree", "institution"])
+    def test_missing_required_field(self, sample_degree_data, missing):
+        """Test degree name and institution are required."""
+        del sample_degree_data[missing]
+        with pytest.raises(ValidationError, match=missing):
             Degree(**sample_degree_data)
 
     def test_graduation_date_parsing(self):
@@ -63,34 +58,24 @@ class TestCertificationValidation:
         assert cert.name == "AWS Solutions Architect"
         assert cert.issuer == "Amazon Web Services"
 
-    def test_missing_required_name(self, sample_certification_data):
-        """Test name is required."""
-        del sample_certification_data["name"]
-        with pytest.raises(ValidationError, match="name"):
+    @pytest.mark.parametrize("missing", ["name", "issuer"])
+    def test_missing_required_field(self, sample_certification_data, missing):
+        """Test certification name and issuer are required."""
+        del sample_certification_data[missing]
+        with pytest.raises(ValidationError, match=missing):
             Certification(**sample_certification_data)
 
-    def test_missing_required_issuer(self, sample_certification_data):
-        """Test issuer is required."""
-        del sample_certification_data["issuer"]
-        with pytest.raises(ValidationError, match="issuer"):
-            Certification(**sample_certification_data)
-
-    def test_is_expired_false_when_no_expiration(self, sample_certification_data):
-        """Test is_expired returns False when no expiration date."""
-        cert = Certification(**sample_certification_data)
-        assert not cert.is_expired
-
-    def test_is_expired_true_when_expired(self, sample_certification_data):
-        """Test is_expired returns True for past expiration."""
-        sample_certification_data["expiration_date"] = "2020-01-01"
-        cert = Certification(**sample_certification_data)
-        assert cert.is_expired
-
-    def test_is_expired_false_when_future(self, sample_certification_data):
-        """Test is_expired returns False for future expiration."""
-        sample_certification_data["expiration_date"] = "2099-01-01"
+    @pytest.mark.parametrize(
+        ("expiration_date", "expected"),
+        [(None, False), ("2020-01-01", True), ("2099-01-01", False)],
+        ids=["no-expiration", "past", "future"],
+    )
+    def test_is_expired(self, sample_certification_data, expiration_date, expected):
+        """Test is_expired compares the expiration date with today."""
+        if expiration_date is not None:
+            sample_certification_data["expiration_date"] = expiration_date
         cert = Certification(**sample_certification_data)
-        assert not cert.is_expired
+        assert cert.is_expired is expected
 
 
 class TestEducation:
@@ -102,17 +87,17 @@ class TestEducation:
         assert edu.degrees == []
         assert edu.certifications == []
 
-    def test_get_most_recent_degree(self, sample_degree_data):
+    def test_get_most_recent_degree(self):
         """Test getting most recent degree."""
-        older = Degree(
+        older = Degree.model_construct(
             degree="BS CS",
             institution="Old University",
-            graduation_date="2015-05-01",
+            graduation_date=date(2015, 5, 1),
         )
-        newer = Degree(
+        newer = Degree.model_construct(
             degree="MS CS",
             institution="New University",
-            graduation_date="2018-05-01",
+            graduation_date=date(2018, 5, 1),
         )
         edu = Education(degrees=[older, newer])
         most_recent = edu.get_most_recent_degree()
@@ -124,13 +109,17 @@ class TestEducation:
         edu = Education()
         assert edu.get_most_recent_degree() is None
 
-    def test_get_active_certifications(self, sample_certification_data):
+    def test_get_active_certifications(self):
         """Test filtering active certifications."""
-        active = Certification(**sample_certification_data)
-        expired = Certification(
+        active = Certification.model_construct(
+            name="AWS Solutions Architect",
+            issuer="Amazon Web Services",
+            date_obtained=date(2022, 6, 1),
+        )
+        expired = Certification.model_construct(
             name="Old Cert",
             issuer="Some Org",
-            expiration_date="2020-01-01",
+            expiration_date=date(2020, 1, 1),
         )
         edu = Education(certifications=[active, expired])
         active_certs = edu.get_active_certifications()
@@ -141,19 +130,27 @@ class TestEducation:
 class TestEducationSerialization:
     """Tests for Education YAML serialization."""
 
-    def test_yaml_roundtrip(self, sample_degree_data, sample_certification_data, temp_directory):
+    def test_yaml_roundtrip(self, sample_degree_data, sample_certification_data):
         """Test education survives YAML round-trip."""
         edu = Education(
             degrees=[Degree(**sample_degree_data)],
             certifications=[Certification(**sample_certification_data)],
         )
 
-        yaml_path = temp_directory / "education.yaml"
-        edu.to_yaml_file(yaml_path)
-
-        loaded = Education.from_yaml_file(yaml_path)
+        loaded = Education.from_yaml(edu.to_yaml())
 
         assert len(loaded.degrees) == 1
         assert loaded.degrees[0].degree == "BS Computer Science"
         assert len(loaded.certifications) == 1
         assert loaded.certifications[0].name == "AWS Solutions Architect"
+
+    def test_yaml_file_io(self, temp_directory):
+        """Test education is written to and read from a file with source tracking."""
+        edu = Education(degrees=[Degree(degree="BS CS", institution="State University")])
+
+        yaml_path = temp_directory / "education.yaml"
+        edu.to_yaml_file(yaml_path)
+        loaded = Education.from_yaml_file(yaml_path)
+
+        assert loaded.degrees[0].degree == "BS CS"
+        assert loaded.get_source_file() == yaml_path
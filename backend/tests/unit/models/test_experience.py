@@ -66,6 +66,7 @@ class TestExperienceEntryValidation:
             start_date="2020-01-01",
         )
         assert entry.is_current is True
+        assert "is_current" in entry.model_fields_set
 
     def test_end_date_before_start_date_rejected(self):
         """Test end_date before start_date is rejected."""
@@ -168,18 +169,40 @@ class TestExperience:
         exp = Experience(entries=entries)
         assert exp.get_total_experience_years() == 4.0
 
+    def test_total_experience_counts_overlap_once(self):
+        """Test concurrent positions are not double-counted."""
+        exp = Experience(
+            entries=[
+                ExperienceEntry(title="Engineer", company="A", start_date="2018-01-01", end_date="2021-01-01"),
+                ExperienceEntry(title="Advisor", company="B", start_date="2019-01-01", end_date="2020-01-01"),
+                ExperienceEntry(title="Lead", company="C", start_date="2020-07-01", end_date="2022-01-01"),
+                ExperienceEntry(title="Contractor", company="D", start_date="2023-01-01", end_date="2024-01-01"),
+            ]
+        )
+
+        # 2018-01..2022-01 (48 months) + 2023-01..2024-01 (12 months)
+        assert exp.get_total_experience_years() == 5.0
+
+    def test_get_keywords_reflects_entry_changes(self, sample_experience_entry):
+        """Test keywords follow reassigned entries and entries mutated in place."""
+        exp = Experience(entries=[ExperienceEntry(**sample_experience_entry)])
+        assert exp.get_keywords() == {"Python", "Kubernetes", "CI/CD"}
+
+        exp.entries = [ExperienceEntry(title="Engineer", company="Acme", start_date="2019-01-01", keywords=["Go"])]
+        assert exp.get_keywords() == {"Go"}
+
+        exp.entries[0].keywords.append("Rust")
+        assert exp.get_keywords() == {"Go", "Rust"}
+
 
 class TestExperienceSerialization:
     """Tests for Experience YAML serialization."""
 
-    def test_yaml_roundtrip(self, sample_experience_entry, temp_directory):
+    def test_yaml_roundtrip(self, sample_experience_entry):
         """Test experience survives YAML round-trip."""
         exp = Experience(entries=[ExperienceEntry(**sample_experience_entry)])
 
-        yaml_path = temp_directory / "experience.yaml"
-        exp.to_yaml_file(yaml_path)
-
-        loaded = Experience.from_yaml_file(yaml_path)
+        loaded = Experience.from_yaml(exp.to_yaml())
 
         assert len(loaded.entries) == 1
         assert loaded.entries[0].company == "Tech Corp"
@@ -1,14 +1,16 @@
 """Tests for MasterResume composite model."""
 
+from datetime import date
+
 import pytest
 from pydantic import ValidationError
 
 from app.models.achievement import Achievement, Achievements
-from app.models.education import Degree, Education
+from app.models.education import Certification, Degree, Education
 from app.models.experience import Experience, ExperienceEntry
 from app.models.master_resume import MasterResume
 from app.models.profile import Profile
-from app.models.skills import Skills
+from app.models.skills import Skill, Skills
 
 
 class TestMasterResumeValidation:
@@ -113,6 +115,18 @@ class TestMasterResumeDirectoryOperations:
         assert not (output_dir / "education.yaml").exists()
         assert not (output_dir / "achievements.md").exists()
 
+    def test_to_directory_writes_skills_with_only_secondary_categories(self, sample_profile_data, temp_directory):
+        """Test skills.yaml is written when only databases/cloud/domains/methodologies are set."""
+        resume = MasterResume(
+            profile=Profile(**sample_profile_data),
+            skills=Skills(databases=["PostgreSQL"], methodologies=["Agile"]),
+        )
+        resume.to_directory(temp_directory)
+
+        loaded = MasterResume.from_directory(temp_directory)
+        assert loaded.skills.databases == ["PostgreSQL"]
+        assert loaded.skills.methodologies == ["Agile"]
+
     def test_directory_roundtrip(
         self,
         sample_profile_data,
@@ -142,6 +156,45 @@ class TestMasterResumeDirectoryOperations:
         assert loaded.skills.languages == original.skills.languages
         assert len(loaded.achievements.entries) == len(original.achievements.entries)
 
+    def test_trusted_load_matches_validated_load(
+        self,
+        sample_profile_data,
+        sample_experience_entry,
+        sample_degree_data,
+        sample_certification_data,
+        sample_skills_data,
+        temp_directory,
+    ):
+        """Test trusted loading of a saved directory yields the same models."""
+        sample_profile_data["address"] = {"city": "Boston", "state": "MA", "zip_code": "02101"}
+        sample_skills_data["languages"].append({"name": "Rust", "proficiency": "advanced"})
+        MasterResume(
+            profile=Profile(**sample_profile_data),
+            experience=Experience(entries=[ExperienceEntry(**sample_experience_entry)]),
+            education=Education(
+                degrees=[Degree(**sample_degree_data)],
+                certifications=[Certification(**sample_certification_data)],
+            ),
+            skills=Skills(**sample_skills_data),
+        ).to_directory(temp_directory)
+
+        validated = MasterResume.from_directory(temp_directory)
+        trusted = MasterResume.from_directory(temp_directory, trusted=True)
+
+        assert trusted == validated
+        assert isinstance(trusted.experience.entries[0].start_date, date)
+        assert isinstance(trusted.skills.languages[-1], Skill)
+
+    def test_to_directory_validates_before_writing(self, sample_profile_data, temp_directory):
+        """Test an invalid mutated resume is rejected before any file is written."""
+        resume = MasterResume(profile=Profile(**sample_profile_data))
+        resume.profile.name = ""
+
+        output_dir = temp_directory / "invalid"
+        with pytest.raises(ValidationError):
+            resume.to_directory(output_dir)
+        assert not output_dir.exists()
+
 
 class TestMasterResumeMethods:
     """Tests for MasterResume helper methods."""
@@ -175,6 +228,20 @@ class TestMasterResumeMethods:
         # From achievement keywords
         assert "Architecture" in keywords
 
+    def test_get_all_keywords_reflects_section_changes(self, sample_profile_data, sample_experience_entry):
+        """Test keywords follow changes made inside a section."""
+        resume = MasterResume(profile=Profile(**sample_profile_data), skills=Skills(languages=["Python"]))
+        assert resume.get_all_keywords() == {"Python"}
+
+        resume.skills.languages = ["Rust"]
+        assert resume.get_all_keywords() == {"Rust"}
+
+        resume.skills.languages.append("Go")
+        assert resume.get_all_keywords() == {"Rust", "Go"}
+
+        resume.experience.entries = [ExperienceEntry(**sample_experience_entry)]
+        assert resume.get_all_keywords() == {"Rust", "Go", "Python", "Kubernetes", "CI/CD"}
+
     def test_validate_completeness_complete_profile(
         self,
         sample_profile_data,
@@ -81,16 +81,11 @@ class TestProfileValidation:
 class TestProfileSerialization:
     """Tests for Profile YAML serialization."""
 
-    def test_yaml_roundtrip(self, sample_profile_data, temp_directory):
+    def test_yaml_roundtrip(self, sample_profile_data):
         """Test profile survives YAML round-trip."""
         profile = Profile(**sample_profile_data)
 
-        # Write to YAML
-        yaml_path = temp_directory / "profile.yaml"
-        profile.to_yaml_file(yaml_path)
-
-        # Read back
-        loaded = Profile.from_yaml_file(yaml_path)
+        loaded = Profile.from_yaml(profile.to_yaml())
 
         assert loaded.name == profile.name
         assert loaded.email == profile.email
@@ -70,6 +70,21 @@ class TestSkillsValidation:
         assert isinstance(skills.languages[1], Skill)
         assert skills.languages[1].name == "TypeScript"
 
+    def test_invalid_skill_entry_type(self):
+        """Test entries that are neither strings, dicts nor Skills are rejected."""
+        with pytest.raises(ValidationError, match="Invalid skill type"):
+            Skills(languages=[42])
+
+    def test_skill_entry_subclasses_accepted(self):
+        """Test subclasses of the dispatched types are still normalized."""
+
+        class SkillDict(dict):
+            pass
+
+        skills = Skills(languages=[SkillDict(name="Go")])
+        assert isinstance(skills.languages[0], Skill)
+        assert skills.languages[0].name == "Go"
+
 
 class TestSkillsMethods:
     """Tests for Skills helper methods."""
@@ -99,6 +114,28 @@ class TestSkillsMethods:
         assert "Python" in all_skills
         assert "TypeScript" in all_skills
 
+    def test_iter_technical_skills_order(self):
+        """Test technical skill names are yielded category by category."""
+        skills = Skills(
+            cloud=["AWS"],
+            languages=["Python", Skill(name="Go")],
+            tools=["Docker"],
+            soft_skills=["Leadership"],
+        )
+        assert list(skills.iter_technical_skills()) == ["Python", "Go", "Docker", "AWS"]
+
+    def test_technical_skills_cache_invalidation(self):
+        """Test cached skill names refresh on reassignment and invalidate_cache()."""
+        skills = Skills(languages=["Python"])
+        assert skills.get_all_technical_skills() == ["Python"]
+
+        skills.languages = ["Go"]
+        assert skills.get_all_technical_skills() == ["Go"]
+
+        skills.languages.append("Rust")
+        skills.invalidate_cache()
+        assert skills.get_all_technical_skills() == ["Go", "Rust"]
+
     def test_search_skill_by_name(self, sample_skills_data):
         """Test searching skills by name."""
         skills = Skills(**sample_skills_data)
@@ -120,6 +157,18 @@ class TestSkillsMethods:
         assert isinstance(matches[0], Skill)
         assert matches[0].name == "JavaScript"
 
+    def test_search_skill_matches_once_per_skill(self):
+        """Test a skill matching by name and several aliases is returned once."""
+        skills = Skills(languages=[Skill(name="JavaScript", aliases=["JS", "ECMAScript"])])
+        assert len(skills.search_skill("script")) == 1
+
+    def test_search_skill_reflects_reassignment(self):
+        """Test search sees skills added by reassigning a category."""
+        skills = Skills(languages=["Python"])
+        assert skills.search_skill("go") == []
+        skills.languages = ["Python", "Go"]
+        assert skills.search_skill("go") == ["Go"]
+
     def test_search_skill_no_matches(self, sample_skills_data):
         """Test search returns empty when no matches."""
         skills = Skills(**sample_skills_data)
@@ -130,20 +179,17 @@ class TestSkillsMethods:
 class TestSkillsSerialization:
     """Tests for Skills YAML serialization."""
 
-    def test_yaml_roundtrip(self, sample_skills_data, temp_directory):
+    def test_yaml_roundtrip(self, sample_skills_data):
         """Test skills survives YAML round-trip."""
         skills = Skills(**sample_skills_data)
 
-        yaml_path = temp_directory / "skills.yaml"
-        skills.to_yaml_file(yaml_path)
-
-        loaded = Skills.from_yaml_file(yaml_path)
+        loaded = Skills.from_yaml(skills.to_yaml())
 
         assert loaded.languages == sample_skills_data["languages"]
         assert loaded.frameworks == sample_skills_data["frameworks"]
         assert loaded.soft_skills == sample_skills_data["soft_skills"]
 
-    def test_yaml_roundtrip_with_skill_objects(self, temp_directory):
+    def test_yaml_roundtrip_with_skill_objects(self):
         """Test Skill objects survive YAML round-trip."""
         skills = Skills(
             languages=[
@@ -152,10 +198,7 @@ class TestSkillsSerialization:
             ]
         )
 
-        yaml_path = temp_directory / "skills.yaml"
-        skills.to_yaml_file(yaml_path)
-
-        loaded = Skills.from_yaml_file(yaml_path)
+        loaded = Skills.from_yaml(skills.to_yaml())
 
         assert loaded.languages[0] == "Python"
         # When loaded from YAML, nested objects become Skill instances
@@ -7,12 +7,27 @@ from pydantic_core import PydanticCustomError
 
 from app.models.validators import (
     parse_date_flexible,
+    validate_email,
     validate_github_url,
     validate_linkedin_url,
     validate_phone,
 )
 
 
+class TestValidateEmail:
+    """Tests for email validation."""
+
+    def test_valid_email(self):
+        """Test common email formats are accepted."""
+        assert validate_email("jane.doe+cv@mail.example.com") == "jane.doe+cv@mail.example.com"
+
+    @pytest.mark.parametrize("email", ["not-an-email", "jane@example", "jane@example.com\n", "a" * 250 + "@x.io"])
+    def test_invalid_email(self, email):
+        """Test malformed, trailing-newline and oversized emails are rejected."""
+        with pytest.raises(PydanticCustomError, match="Invalid email format"):
+            validate_email(email)
+
+
 class TestValidatePhone:
     """Tests for phone number validation."""
 
@@ -41,6 +56,16 @@ class TestValidatePhone:
         with pytest.raises(PydanticCustomError, match="Invalid phone number"):
             validate_phone("+1 (555) CALL-ME")
 
+    @pytest.mark.parametrize("phone", ["555-123+4567", "++1 555 123 4567", "+1 555 123 4567 8901 2345"])
+    def test_invalid_phone_plus_placement_and_length(self, phone):
+        """Test a + only after separators at the start, and at most 15 digits."""
+        with pytest.raises(PydanticCustomError, match="Invalid phone number"):
+            validate_phone(phone)
+
+    def test_valid_phone_with_dots_and_leading_space(self):
+        """Test separators may appear anywhere, including before the +."""
+        assert validate_phone(" +1.555.123.4567") == " +1.555.123.4567"
+
 
 class TestValidateLinkedInUrl:
     """Tests for LinkedIn URL validation."""
@@ -80,6 +105,21 @@ class TestValidateLinkedInUrl:
         result = validate_linkedin_url("linkedin.com/in/john.doe")
         assert result == "https://linkedin.com/in/john.doe"
 
+    def test_host_taken_after_userinfo(self):
+        """Test userinfo before @ cannot spoof the LinkedIn host."""
+        with pytest.raises(PydanticCustomError, match="Invalid LinkedIn URL"):
+            validate_linkedin_url("https://linkedin.com@evil.com/in/janedeveloper")
+
+    def test_port_query_and_fragment_ignored(self):
+        """Test the host port and the URL query/fragment do not affect validation."""
+        url = "https://www.LinkedIn.com:443/in/janedeveloper/?trk=profile#about"
+        assert validate_linkedin_url(url) == url
+
+    def test_profile_path_without_username_rejected(self):
+        """Test a bare /in/ path is rejected."""
+        with pytest.raises(PydanticCustomError, match="Invalid LinkedIn URL"):
+            validate_linkedin_url("https://linkedin.com/in/")
+
 
 class TestValidateGitHubUrl:
     """Tests for GitHub URL validation."""
@@ -143,6 +183,16 @@ class TestParseDateFlexible:
         result = parse_date_flexible("DECEMBER 2023")
         assert result == date(2023, 12, 1)
 
+    def test_month_abbreviation_year(self):
+        """Test abbreviated month names are accepted."""
+        assert parse_date_flexible("Jan 2024") == date(2024, 1, 1)
+        assert parse_date_flexible("sept 2023") == date(2023, 9, 1)
+
+    def test_iso_shape_with_non_digits_rejected(self):
+        """Test strings shaped like ISO dates but containing letters are rejected."""
+        with pytest.raises(PydanticCustomError, match="Invalid date format"):
+            parse_date_flexible("2024-ab-15")
+
     def test_date_object_passthrough(self):
         """Test date object is passed through."""
         input_date = date(2024, 6, 15)
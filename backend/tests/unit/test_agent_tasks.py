@@ -0,0 +1,127 @@
+"""Unit tests for background agent task execution."""
+
+import asyncio
+
+import pytest
+
+from app.agents.metadata import AgentMetadata, AgentResponse
+from app.agents.tasks import AgentTaskQueue
+
+
+class _FakeAgent:
+    """Minimal stand-in exposing the attributes AgentTaskQueue uses."""
+
+    def __init__(self, name="fake-agent", delay=0.0, fail=False):
+        self.name = name
+        self.delay = delay
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+
+    async def run(self, task):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail:
+                raise RuntimeError("boom")
+            return AgentResponse(
+                status="success",
+                output=f"done {task}",
+                metadata=AgentMetadata(agent_name=self.name, model_used="sonnet"),
+            )
+        finally:
+            self.running -= 1
+
+
+class TestAgentTaskQueue:
+    """Tests for AgentTaskQueue."""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_wait_returns_response(self):
+        """Test submit hands back an ID and wait yields the finished task."""
+        queue = AgentTaskQueue(max_concurrency=2)
+        task_id = queue.submit(_FakeAgent(delay=0.01), "job")
+
+        assert queue.get(task_id).status in ("pending", "running")
+
+        task = await queue.wait(task_id)
+
+        assert task.status == "done"
+        assert task.response.output == "done job"
+        assert task.agent_name == "fake-agent"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency runs execute at once."""
+        queue = AgentTaskQueue(max_concurrency=2)
+        agent = _FakeAgent(delay=0.01)
+        task_ids = [queue.submit(agent, i) for i in range(6)]
+
+        for task_id in task_ids:
+            await queue.wait(task_id)
+
+        assert agent.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self):
+        """Test an exception from run marks the task failed."""
+        queue = AgentTaskQueue(max_concurrency=1)
+        task = await queue.wait(queue.submit(_FakeAgent(fail=True), "job"))
+
+        assert task.status == "failed"
+        assert task.error == "RuntimeError: boom"
+        assert task.response is None
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_pending_tasks(self):
+        """Test shutdown cancels unfinished runs."""
+        queue = AgentTaskQueue(max_concurrency=1)
+        task_id = queue.submit(_FakeAgent(delay=10), "job")
+        await asyncio.sleep(0)
+
+        await queue.shutdown()
+
+        assert queue.get(task_id).status == "failed"
+        assert queue.get(task_id).error == "cancelled"
+
+    def test_unknown_task_id(self):
+        """Test get returns None for unknown IDs."""
+        assert AgentTaskQueue(max_concurrency=1).get("missing") is None
+
+    def test_invalid_concurrency(self):
+        """Test max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AgentTaskQueue(max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_pruned(self):
+        """Test only the newest max_finished finished tasks are kept."""
+        queue = AgentTaskQueue(max_concurrency=1, max_finished=1)
+        first = queue.submit(_FakeAgent(), "first")
+        second = queue.submit(_FakeAgent(), "second")
+
+        assert (await queue.wait(first)).status == "done"
+        await queue.wait(second)
+
+        assert queue.get(first) is None
+        assert queue.get(second).response.output == "done second"
+        assert queue._tasks == {}
+        with pytest.raises(KeyError):
+            await queue.wait(first)
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_expire(self):
+        """Test finished tasks are dropped once the retention period has passed."""
+        queue = AgentTaskQueue(max_concurrency=1, retention=0.01)
+        task_id = queue.submit(_FakeAgent(), "job")
+        await queue.wait(task_id)
+
+        await asyncio.sleep(0.02)
+
+        assert queue.get(task_id) is None
+
+    def test_invalid_retention(self):
+        """Test retention must be positive."""
+        with pytest.raises(ValueError, match="ttl"):
+            AgentTaskQueue(max_concurrency=1, retention=0)
@@ -0,0 +1,48 @@
+"""Unit tests for in-process caching utilities."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_get_and_set(self):
+        """Test values can be stored and read back."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        cache["a"] = 1
+
+        assert cache["a"] == 1
+        assert cache.get("missing") is None
+        assert len(cache) == 1
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted at capacity."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        cache["a"] = 1
+        cache["b"] = 2
+        _ = cache["a"]
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert list(cache) == ["a", "c"]
+
+    def test_entries_expire(self):
+        """Test entries are dropped once their TTL has elapsed."""
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+        with patch("app.utils.cache.time.monotonic", return_value=100.0):
+            cache["a"] = 1
+        with patch("app.utils.cache.time.monotonic", return_value=109.0):
+            assert cache["a"] == 1
+        with patch("app.utils.cache.time.monotonic", return_value=110.0):
+            assert "a" not in cache
+            assert len(cache) == 0
+
+    @pytest.mark.parametrize(("maxsize", "ttl"), [(0, 10), (1, 0)])
+    def test_invalid_configuration(self, maxsize, ttl):
+        """Test non-positive sizes and TTLs are rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=maxsize, ttl=ttl)
@@ -1,5 +1,6 @@
 """Unit tests for retry utilities with exponential backoff."""
 
+import asyncio
 import logging
 from unittest.mock import MagicMock
 
@@ -7,6 +8,7 @@ import pytest
 
 from app.utils.retry import (
     RetryConfig,
+    retry_async,
     retry_async_generator,
     retry_on_transient_error,
 )
@@ -79,6 +81,12 @@ class TestRetryConfig:
         # attempt 10: min(1024.0, 5.0) = 5.0 (capped)
         assert config.calculate_delay(10) == 5.0
 
+    def test_calculate_delay_many_attempts_does_not_overflow(self):
+        """Test a large max_attempts saturates at max_delay instead of overflowing."""
+        config = RetryConfig(max_attempts=5000, max_delay=5.0, jitter=False)
+
+        assert config.calculate_delay(4000) == 5.0
+
     def test_calculate_delay_with_jitter(self):
         """Test jitter adds randomization within expected range."""
         config = RetryConfig(
@@ -139,6 +147,11 @@ class TestRetryConfig:
         with pytest.raises(ValueError, match="exponential_base must be >= 1"):
             RetryConfig(exponential_base=0.5)
 
+    def test_total_timeout_must_be_positive(self):
+        """Test non-positive total_timeout is rejected."""
+        with pytest.raises(ValueError, match="total_timeout"):
+            RetryConfig(total_timeout=0)
+
 
 class TestRetryOnTransientError:
     """Tests for the retry_on_transient_error decorator."""
@@ -262,7 +275,7 @@ class TestRetryOnTransientError:
                 raise ConnectionError("Temporary failure")
             return "success"
 
-        with caplog.at_level(logging.WARNING):
+        with caplog.at_level(logging.WARNING, logger="app.utils.retry"):
             await fails_twice()
 
         # Should have logged 2 retry attempts (format: "Attempt X/Y failed")
@@ -326,6 +339,91 @@ class TestRetryOnTransientError:
         assert call_count == 2
 
 
+class TestRetryAsync:
+    """Tests for the retry_async helper."""
+
+    @pytest.mark.asyncio
+    async def test_retries_then_returns_result(self):
+        """Test a fresh awaitable is created per attempt until one succeeds."""
+        call_count = 0
+
+        async def flaky():
+            nonlocal call_count
+            call_count += 1
+            if call_count < 3:
+                raise TimeoutError("slow")
+            return "ok"
+
+        result = await retry_async(
+            flaky,
+            retryable_exceptions=(TimeoutError,),
+            config=RetryConfig(max_attempts=3, base_delay=0.01, jitter=False),
+        )
+
+        assert result == "ok"
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_raises_last_exception_when_exhausted(self):
+        """Test the final attempt's exception propagates unchanged."""
+        call_count = 0
+
+        async def always_fails():
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError(f"failure {call_count}")
+
+        with pytest.raises(ConnectionError, match="failure 2"):
+            await retry_async(
+                always_fails,
+                retryable_exceptions=(ConnectionError,),
+                config=RetryConfig(max_attempts=2, base_delay=0.01, jitter=False),
+            )
+
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_single_attempt_does_not_retry(self):
+        """Test max_attempts=1 calls once and raises without sleeping."""
+        call_count = 0
+
+        async def fails():
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("down")
+
+        with pytest.raises(ConnectionError):
+            await retry_async(fails, (ConnectionError,), RetryConfig(max_attempts=1))
+
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_total_timeout_stops_retrying_at_deadline(self):
+        """Test retries stop once total_timeout has elapsed instead of sleeping on."""
+        call_count = 0
+
+        async def fails():
+            nonlocal call_count
+            call_count += 1
+            raise ConnectionError("down")
+
+        config = RetryConfig(max_attempts=10, base_delay=0.05, jitter=False, total_timeout=0.1)
+        with pytest.raises(ConnectionError):
+            await asyncio.wait_for(retry_async(fails, (ConnectionError,), config), timeout=1.0)
+
+        assert 1 < call_count < 10
+
+    @pytest.mark.asyncio
+    async def test_total_timeout_bounds_slow_attempt(self):
+        """Test an attempt still running at the deadline raises TimeoutError."""
+
+        async def slow():
+            await asyncio.sleep(1.0)
+
+        with pytest.raises(TimeoutError):
+            await retry_async(slow, (ConnectionError,), RetryConfig(max_attempts=1, total_timeout=0.05))
+
+
 class TestRetryAsyncGenerator:
     """Tests for the retry_async_generator wrapper."""
 
@@ -472,6 +570,31 @@ class TestRetryAsyncGenerator:
         await gen.aclose()
         assert cleanup_called
 
+    @pytest.mark.asyncio
+    async def test_generator_cleanup_error_does_not_mask_original(self, caplog):
+        """Test a failing aclose() is logged and the original error still propagates."""
+
+        class FailingStream:
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                raise ValueError("Original failure")
+
+            async def aclose(self):
+                raise OSError("Cleanup failure")
+
+        with caplog.at_level(logging.WARNING, logger="app.utils.retry"):
+            with pytest.raises(ValueError, match="Original failure"):
+                async for _ in retry_async_generator(
+                    generator_factory=FailingStream,
+                    retryable_exceptions=(ConnectionError,),
+                    config=RetryConfig(max_attempts=3, base_delay=0.01),
+                ):
+                    pass
+
+        assert any("Cleanup failure" in r.message for r in caplog.records)
+
     @pytest.mark.asyncio
     async def test_generator_logs_retries(self, caplog):
         """Test generator logs retry attempts."""
@@ -484,7 +607,7 @@ class TestRetryAsyncGenerator:
                 raise ConnectionError("Initial failure")
             yield "success"
 
-        with caplog.at_level(logging.WARNING):
+        with caplog.at_level(logging.WARNING, logger="app.utils.retry"):
             results = []
             async for chunk in retry_async_generator(
                 generator_factory=fails_initially,